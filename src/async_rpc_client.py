@@ -0,0 +1,175 @@
+"""
+Asynchronous Bitcoin RPC Client built on aiohttp for non-blocking RPC fan-out
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import ssl
+from typing import Any, Dict, List, Tuple
+
+# Only the async client needs aiohttp; the synchronous CLI runs without it
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from commands.validators import InputValidator
+# Share the sync client's orjson-or-stdlib codec for bodies and responses
+from rpc_client import (
+    DEFAULT_HEADERS, HTTP_ERROR_MESSAGES, BitcoinRPCError, basic_auth_header, _json_dumps, _json_loads
+)
+
+
+class AsyncBitcoinRPCClient:
+    """Asynchronous Bitcoin RPC client sharing one aiohttp session across calls"""
+    
+    def __init__(self, config, pool_size: int = 20):
+        if aiohttp is None:
+            raise ImportError("AsyncBitcoinRPCClient requires aiohttp (pip install aiohttp)")
+        
+        self.config = config
+        self.pool_size = pool_size
+        self.logger = logging.getLogger(__name__)
+        self.session = None
+        # Request ids only need to be unique within this client
+        self._req_ids = itertools.count(1)
+    
+    def _ssl_option(self):
+        """Build the aiohttp ssl argument from configuration"""
+        if not self.config.use_ssl:
+            return None
+        
+        if not self.config.ssl_verify:
+            self.logger.warning("SSL certificate verification disabled")
+            return False
+        
+        context = ssl.create_default_context()
+        if self.config.ssl_cert_path:
+            context.load_cert_chain(self.config.ssl_cert_path)
+            self.logger.info(f"Using SSL certificate: {self.config.ssl_cert_path}")
+        return context
+    
+    def _setup_session(self):
+        """Setup aiohttp session with a keep-alive connection pool (needs a running loop)"""
+        self.session = aiohttp.ClientSession(
+            headers={**DEFAULT_HEADERS, 'Authorization': basic_auth_header(*self.config.auth)},
+            connector=aiohttp.TCPConnector(limit=self.pool_size, ssl=self._ssl_option()),
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+        
+        self.logger.debug("Async HTTP session configured successfully")
+    
+    def _create_request(self, method: str, params: List[Any] = None) -> Dict[str, Any]:
+        """Create JSON-RPC request"""
+        request_id = next(self._req_ids)
+        
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params or []
+        }
+    
+    async def _handle_response(self, response: 'aiohttp.ClientResponse') -> Any:
+        """Handle and validate RPC response"""
+        if response.status >= 400:
+            self.logger.error(f"HTTP error: {response.status}")
+            message = HTTP_ERROR_MESSAGES.get(response.status)
+            if message is None:
+                message = f"HTTP {response.status}: {await response.text()}"
+            raise BitcoinRPCError(message, -1)
+        
+        body = await response.read()
+        try:
+            data = _json_loads(body)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Invalid JSON response: {e}")
+            raise BitcoinRPCError(f"Invalid JSON response: {body.decode('utf-8', 'replace')}", -32700)
+        
+        if not isinstance(data, dict):
+            self.logger.error(f"Unexpected RPC response: {data!r}")
+            raise BitcoinRPCError("Invalid RPC response", -32603)
+        
+        # Handle JSON-RPC error response
+        if "error" in data and data["error"] is not None:
+            error = data["error"]
+            if not isinstance(error, dict):
+                raise BitcoinRPCError(str(error), -1)
+            raise BitcoinRPCError(
+                error.get("message", "Unknown RPC error"),
+                error.get("code", -1),
+                error.get("data")
+            )
+        
+        return data.get("result")
+    
+    async def call(self, method: str, params: List[Any] = None) -> Any:
+        """Make RPC call to Bitcoin node without blocking the event loop"""
+        if not self.session:
+            self._setup_session()
+        
+        # Validate and sanitize parameters
+        if params:
+            try:
+                params = InputValidator.validate_json_rpc_params(params)
+            except ValueError as e:
+                raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
+        
+        # Params that cannot be serialized are a caller error, as in BitcoinRPCClient.call
+        # (orjson.JSONEncodeError subclasses TypeError)
+        try:
+            body = _json_dumps(self._create_request(method, params))
+        except (TypeError, ValueError, OverflowError) as e:
+            raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
+        
+        self.logger.debug("Async RPC call: %s with params: %s", method, params)
+        
+        try:
+            async with self.session.post(self.config.rpc_url, data=body) as response:
+                result = await self._handle_response(response)
+            self.logger.debug("Async RPC call successful: %s", method)
+            return result
+        
+        # ServerTimeoutError is also a ClientConnectionError, so timeouts go first
+        except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Request timeout: {e}")
+            raise BitcoinRPCError(f"Request timeout after {self.config.timeout} seconds", -1)
+        
+        except aiohttp.ClientConnectionError as e:
+            self.logger.error(f"Connection error: {e}")
+            raise BitcoinRPCError(f"Cannot connect to Bitcoin node at {self.config.rpc_url}", -1)
+        
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Request error: {e}")
+            raise BitcoinRPCError(f"Request failed: {e}", -1)
+    
+    async def gather(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Make independent RPC calls concurrently, returning results in call order
+        
+        Latency is that of the slowest call rather than the sum of all of them.
+        The first failing call's BitcoinRPCError is raised.
+        
+        Args:
+            calls: List of (method, params) tuples
+        """
+        return list(await asyncio.gather(*(self.call(method, params) for method, params in calls)))
+    
+    async def close(self):
+        """Close the HTTP session"""
+        if self.session:
+            await self.session.close()
+            self.session = None
+            self.logger.debug("Async RPC session closed")
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        if not self.session:
+            self._setup_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
@@ -0,0 +1,113 @@
+"""
+Asynchronous blockchain-related Bitcoin RPC commands
+"""
+
+import logging
+from typing import Any, Dict, Union
+from src.commands.validators import validate_block_hash, validate_block_height
+
+
+class AsyncBlockchainCommands:
+    """
+    Handler for blockchain-related RPC commands on an AsyncBitcoinRPCClient
+    
+    Methods mirror BlockchainCommands as coroutines, so many lookups can be
+    awaited together: ``await asyncio.gather(*(cmds.get_block(h) for h in hashes))``
+    """
+    
+    __slots__ = ('rpc_client', 'logger')
+    
+    def __init__(self, rpc_client):
+        self.rpc_client = rpc_client
+        self.logger = logging.getLogger(__name__)
+    
+    async def get_blockchain_info(self) -> Dict[str, Any]:
+        """Get blockchain information"""
+        self.logger.debug("Executing getblockchaininfo")
+        return await self.rpc_client.call("getblockchaininfo")
+    
+    async def get_block_count(self) -> int:
+        """Get the current block count"""
+        self.logger.debug("Executing getblockcount")
+        return await self.rpc_client.call("getblockcount")
+    
+    async def get_block(self, block_hash: str, verbosity: int = 1) -> Union[str, Dict[str, Any]]:
+        """
+        Get block by hash
+        
+        Args:
+            block_hash: The block hash
+            verbosity: 0 = raw hex, 1 = block info, 2 = block info with transactions
+        """
+        # Validate block hash
+        validated_hash = validate_block_hash(block_hash)
+        
+        self.logger.debug("Executing getblock for hash: %s", validated_hash)
+        return await self.rpc_client.call("getblock", [validated_hash, verbosity])
+    
+    async def get_block_hash(self, height: Union[int, str]) -> str:
+        """Get block hash by height"""
+        # Validate block height
+        validated_height = validate_block_height(height)
+        
+        self.logger.debug("Executing getblockhash for height: %s", validated_height)
+        return await self.rpc_client.call("getblockhash", [validated_height])
+    
+    async def get_best_block_hash(self) -> str:
+        """Get the hash of the best (tip) block"""
+        self.logger.debug("Executing getbestblockhash")
+        return await self.rpc_client.call("getbestblockhash")
+    
+    async def get_block_header(self, block_hash: str, verbose: bool = True) -> Union[str, Dict[str, Any]]:
+        """
+        Get block header by hash
+        
+        Args:
+            block_hash: The block hash
+            verbose: If false, return hex-encoded data
+        """
+        validated_hash = validate_block_hash(block_hash)
+        
+        self.logger.debug("Executing getblockheader for hash: %s", validated_hash)
+        return await self.rpc_client.call("getblockheader", [validated_hash, verbose])
+    
+    async def get_chain_tips(self) -> list:
+        """Get information about all known tips in the block tree"""
+        self.logger.debug("Executing getchaintips")
+        return await self.rpc_client.call("getchaintips")
+    
+    async def get_difficulty(self) -> float:
+        """Get the proof-of-work difficulty"""
+        self.logger.debug("Executing getdifficulty")
+        return await self.rpc_client.call("getdifficulty")
+    
+    async def get_mempool_info(self) -> Dict[str, Any]:
+        """Get mempool information"""
+        self.logger.debug("Executing getmempoolinfo")
+        return await self.rpc_client.call("getmempoolinfo")
+    
+    async def get_raw_mempool(self, verbose: bool = False) -> Union[list, Dict[str, Any]]:
+        """
+        Get raw mempool
+        
+        Args:
+            verbose: If true, return verbose information about each transaction
+        """
+        self.logger.debug("Executing getrawmempool")
+        return await self.rpc_client.call("getrawmempool", [verbose])
+    
+    async def get_tx_out_set_info(self) -> Dict[str, Any]:
+        """Get statistics about the unspent transaction output set"""
+        self.logger.debug("Executing gettxoutsetinfo")
+        return await self.rpc_client.call("gettxoutsetinfo")
+    
+    async def verify_chain(self, check_level: int = 3, num_blocks: int = 6) -> bool:
+        """
+        Verify blockchain database
+        
+        Args:
+            check_level: How thorough the block verification is (0-4)
+            num_blocks: The number of blocks to check
+        """
+        self.logger.debug("Executing verifychain with level %s, blocks %s", check_level, num_blocks)
+        return await self.rpc_client.call("verifychain", [check_level, num_blocks])
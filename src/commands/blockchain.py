@@ -3,26 +3,56 @@ Blockchain-related Bitcoin RPC commands
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+from src.commands.cache import ImmutableCache, ttl_cache
 from src.commands.validators import validate_block_hash, validate_block_height
 
+# Blocks buried this deep are treated as final when caching height -> hash
+FINALITY_DEPTH = 6
+
+# Seconds a polled tip result (chain info, block count, chain tips) is reused
+TIP_CACHE_TTL = 2.0
+
 
 class BlockchainCommands:
     """Handler for blockchain-related RPC commands"""
     
-    def __init__(self, rpc_client):
+    __slots__ = (
+        'rpc_client', 'logger', 'cache', '_known_height',
+        # Storage for the @ttl_cache decorated methods
+        '_ttl_get_blockchain_info', '_ttl_get_block_count', '_ttl_get_chain_tips',
+    )
+    
+    def __init__(self, rpc_client, cache_size: int = 100_000):
         self.rpc_client = rpc_client
         self.logger = logging.getLogger(__name__)
+        
+        # Raw blocks/headers are content-addressed and deep block hashes
+        # cannot reorg, so their results are cached for the handler lifetime
+        self.cache = ImmutableCache(cache_size)
+        self._known_height = -1
     
+    def _observe_height(self, height: Optional[int]) -> None:
+        """Remember the highest chain height reported by the node"""
+        if isinstance(height, int) and height > self._known_height:
+            self._known_height = height
+    
+    @ttl_cache(TIP_CACHE_TTL)
     def get_blockchain_info(self) -> Dict[str, Any]:
         """Get blockchain information"""
         self.logger.debug("Executing getblockchaininfo")
-        return self.rpc_client.call("getblockchaininfo")
+        info = self.rpc_client.call("getblockchaininfo")
+        if isinstance(info, dict):
+            self._observe_height(info.get("blocks"))
+        return info
     
+    @ttl_cache(TIP_CACHE_TTL)
     def get_block_count(self) -> int:
         """Get the current block count"""
         self.logger.debug("Executing getblockcount")
-        return self.rpc_client.call("getblockcount")
+        count = self.rpc_client.call("getblockcount")
+        self._observe_height(count)
+        return count
     
     def get_block(self, block_hash: str, verbosity: int = 1) -> Union[str, Dict[str, Any]]:
         """
@@ -35,16 +65,62 @@ class BlockchainCommands:
         # Validate block hash
         validated_hash = validate_block_hash(block_hash)
         
-        self.logger.debug(f"Executing getblock for hash: {validated_hash}")
-        return self.rpc_client.call("getblock", [validated_hash, verbosity])
+        # Only raw blocks are immutable; verbose output carries confirmations
+        cache_key = ("getblock", validated_hash) if verbosity == 0 else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        self.logger.debug("Executing getblock for hash: %s", validated_hash)
+        block = self.rpc_client.call("getblock", [validated_hash, verbosity])
+        
+        if cache_key and block is not None:
+            self.cache.put(cache_key, block)
+        return block
     
     def get_block_hash(self, height: Union[int, str]) -> str:
         """Get block hash by height"""
         # Validate block height
         validated_height = validate_block_height(height)
         
-        self.logger.debug(f"Executing getblockhash for height: {validated_height}")
-        return self.rpc_client.call("getblockhash", [validated_height])
+        cache_key = ("getblockhash", validated_height)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        self.logger.debug("Executing getblockhash for height: %s", validated_height)
+        block_hash = self.rpc_client.call("getblockhash", [validated_height])
+        
+        # Heights near the tip can still be reorganised onto another block
+        if block_hash is not None and validated_height <= self._known_height - FINALITY_DEPTH:
+            self.cache.put(cache_key, block_hash)
+        return block_hash
+    
+    def get_block_hashes_batch(self, heights: List[Union[int, str]]) -> List[str]:
+        """
+        Get block hashes for many heights in a single batch request
+        
+        Args:
+            heights: Block heights, results are returned in the same order
+        """
+        validated_heights = [validate_block_height(height) for height in heights]
+        
+        self.logger.debug("Executing batched getblockhash for %s heights", len(validated_heights))
+        return self.rpc_client.batch_call([("getblockhash", [height]) for height in validated_heights])
+    
+    def get_blocks_batch(self, block_hashes: List[str], verbosity: int = 1) -> List[Union[str, Dict[str, Any]]]:
+        """
+        Get many blocks by hash in a single batch request
+        
+        Args:
+            block_hashes: Block hashes, results are returned in the same order
+            verbosity: 0 = raw hex, 1 = block info, 2 = block info with transactions
+        """
+        validated_hashes = [validate_block_hash(block_hash) for block_hash in block_hashes]
+        
+        self.logger.debug("Executing batched getblock for %s hashes", len(validated_hashes))
+        return self.rpc_client.batch_call([("getblock", [block_hash, verbosity]) for block_hash in validated_hashes])
     
     def get_best_block_hash(self) -> str:
         """Get the hash of the best (tip) block"""
@@ -61,9 +137,34 @@ class BlockchainCommands:
         """
         validated_hash = validate_block_hash(block_hash)
         
-        self.logger.debug(f"Executing getblockheader for hash: {validated_hash}")
-        return self.rpc_client.call("getblockheader", [validated_hash, verbose])
+        # Only the raw header is immutable; verbose output carries confirmations
+        cache_key = ("getblockheader", validated_hash) if not verbose else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        self.logger.debug("Executing getblockheader for hash: %s", validated_hash)
+        header = self.rpc_client.call("getblockheader", [validated_hash, verbose])
+        
+        if cache_key and header is not None:
+            self.cache.put(cache_key, header)
+        return header
+    
+    def get_block_headers_batch(self, block_hashes: List[str], verbose: bool = True) -> List[Union[str, Dict[str, Any]]]:
+        """
+        Get many block headers by hash in a single batch request
+        
+        Args:
+            block_hashes: Block hashes, results are returned in the same order
+            verbose: If false, return hex-encoded data
+        """
+        validated_hashes = [validate_block_hash(block_hash) for block_hash in block_hashes]
+        
+        self.logger.debug("Executing batched getblockheader for %s hashes", len(validated_hashes))
+        return self.rpc_client.batch_call([("getblockheader", [block_hash, verbose]) for block_hash in validated_hashes])
     
+    @ttl_cache(TIP_CACHE_TTL)
     def get_chain_tips(self) -> list:
         """Get information about all known tips in the block tree"""
         self.logger.debug("Executing getchaintips")
@@ -102,5 +203,5 @@ class BlockchainCommands:
             check_level: How thorough the block verification is (0-4)
             num_blocks: The number of blocks to check
         """
-        self.logger.debug(f"Executing verifychain with level {check_level}, blocks {num_blocks}")
+        self.logger.debug("Executing verifychain with level %s, blocks %s", check_level, num_blocks)
         return self.rpc_client.call("verifychain", [check_level, num_blocks])
@@ -0,0 +1,74 @@
+"""
+Client-side caches for RPC results
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Hashable, Optional
+
+
+class ImmutableCache:
+    """Thread-safe bounded LRU cache for RPC results that can never change"""
+    
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def ttl_cache(ttl: float):
+    """
+    Cache the result of an argument-less method per instance for ttl seconds
+    
+    Meant for polled, fast-changing RPCs (tip height, chain tips) where a
+    result a couple of seconds old is as good as a fresh one. The entry is
+    kept in a ``_ttl_<method name>`` attribute, which classes using
+    ``__slots__`` must declare.
+    """
+    def decorator(method):
+        attr = f"_ttl_{method.__name__}"
+        
+        @wraps(method)
+        def wrapper(self):
+            now = time.monotonic()
+            entry = getattr(self, attr, None)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            
+            value = method(self)
+            setattr(self, attr, (now, value))
+            return value
+        
+        return wrapper
+    
+    return decorator
@@ -5,10 +5,40 @@ Network-related Bitcoin RPC commands
 import logging
 from typing import Any, Dict, List, Optional, Union
 
+# Upper bounds on submitted payloads, checked before any decoding
+MAX_BLOCK_BYTES = 4_000_000  # Consensus block weight limit bounds serialized size
+BLOCK_HEADER_BYTES = 80
+
+
+def _validate_hex(hex_data: str, max_bytes: int) -> str:
+    """Validate hex-encoded data of at most max_bytes, cheapest checks first"""
+    if not hex_data or not isinstance(hex_data, str):
+        raise ValueError("hex_data must be a non-empty string")
+    
+    if len(hex_data) > 2 * max_bytes:
+        raise ValueError(f"hex_data exceeds the maximum size of {max_bytes} bytes")
+    
+    if len(hex_data) % 2:
+        raise ValueError("hex_data must have an even number of characters")
+    
+    # Basic hex validation (linear, unlike parsing the payload as an int)
+    try:
+        decoded = bytes.fromhex(hex_data)
+    except ValueError:
+        raise ValueError("hex_data must be valid hexadecimal")
+    
+    # bytes.fromhex skips whitespace, which is not valid in block data
+    if len(decoded) * 2 != len(hex_data):
+        raise ValueError("hex_data must be valid hexadecimal")
+    
+    return hex_data
+
 
 class NetworkCommands:
     """Handler for network-related RPC commands"""
     
+    __slots__ = ('rpc_client', 'logger')
+    
     def __init__(self, rpc_client):
         self.rpc_client = rpc_client
         self.logger = logging.getLogger(__name__)
@@ -39,7 +69,7 @@ class NetworkCommands:
         if command not in ["add", "remove", "onetry"]:
             raise ValueError("Command must be 'add', 'remove', or 'onetry'")
         
-        self.logger.debug(f"Executing addnode: {node}, command: {command}")
+        self.logger.debug("Executing addnode: %s, command: %s", node, command)
         return self.rpc_client.call("addnode", [node, command])
     
     def disconnect_node(self, address: Optional[str] = None, node_id: Optional[int] = None) -> None:
@@ -57,10 +87,10 @@ class NetworkCommands:
             raise ValueError("Cannot specify both address and node_id")
         
         if address:
-            self.logger.debug(f"Executing disconnectnode by address: {address}")
+            self.logger.debug("Executing disconnectnode by address: %s", address)
             return self.rpc_client.call("disconnectnode", [address])
         else:
-            self.logger.debug(f"Executing disconnectnode by id: {node_id}")
+            self.logger.debug("Executing disconnectnode by id: %s", node_id)
             return self.rpc_client.call("disconnectnode", ["", node_id])
     
     def get_added_node_info(self, node: Optional[str] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -71,7 +101,7 @@ class NetworkCommands:
             node: If specified, return info for this node only
         """
         if node:
-            self.logger.debug(f"Executing getaddednodeinfo for node: {node}")
+            self.logger.debug("Executing getaddednodeinfo for node: %s", node)
             return self.rpc_client.call("getaddednodeinfo", [node])
         else:
             self.logger.debug("Executing getaddednodeinfo for all nodes")
@@ -106,7 +136,7 @@ class NetworkCommands:
             if absolute:
                 params.append(absolute)
         
-        self.logger.debug(f"Executing setban: {subnet}, command: {command}")
+        self.logger.debug("Executing setban: %s, command: %s", subnet, command)
         return self.rpc_client.call("setban", params)
     
     def clear_banned(self) -> None:
@@ -129,7 +159,7 @@ class NetworkCommands:
         if count < 1:
             raise ValueError("Count must be at least 1")
         
-        self.logger.debug(f"Executing getnodeaddresses, count: {count}")
+        self.logger.debug("Executing getnodeaddresses, count: %s", count)
         return self.rpc_client.call("getnodeaddresses", [count])
     
     def set_network_active(self, state: bool) -> bool:
@@ -139,7 +169,7 @@ class NetworkCommands:
         Args:
             state: True to enable networking, False to disable
         """
-        self.logger.debug(f"Executing setnetworkactive: {state}")
+        self.logger.debug("Executing setnetworkactive: %s", state)
         return self.rpc_client.call("setnetworkactive", [state])
     
     def submit_block(self, hex_data: str) -> Optional[str]:
@@ -149,14 +179,7 @@ class NetworkCommands:
         Args:
             hex_data: The hex-encoded block data
         """
-        if not hex_data or not isinstance(hex_data, str):
-            raise ValueError("hex_data must be a non-empty string")
-        
-        # Basic hex validation
-        try:
-            int(hex_data, 16)
-        except ValueError:
-            raise ValueError("hex_data must be valid hexadecimal")
+        _validate_hex(hex_data, MAX_BLOCK_BYTES)
         
         self.logger.debug("Executing submitblock")
         return self.rpc_client.call("submitblock", [hex_data])
@@ -185,14 +208,11 @@ class NetworkCommands:
         Args:
             hex_data: The hex-encoded block header data
         """
-        if not hex_data or not isinstance(hex_data, str):
-            raise ValueError("hex_data must be a non-empty string")
+        _validate_hex(hex_data, BLOCK_HEADER_BYTES)
         
-        # Basic hex validation
-        try:
-            int(hex_data, 16)
-        except ValueError:
-            raise ValueError("hex_data must be valid hexadecimal")
+        # Headers have a fixed serialized size
+        if len(hex_data) != 2 * BLOCK_HEADER_BYTES:
+            raise ValueError(f"hex_data must be exactly {BLOCK_HEADER_BYTES} bytes")
         
         self.logger.debug("Executing submitheader")
         return self.rpc_client.call("submitheader", [hex_data])
@@ -0,0 +1,88 @@
+"""
+Block prefetching on top of BlockchainCommands for sequential chain scans
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Union
+
+
+class BlockPrefetcher:
+    """
+    Fetch blocks by height while the caller is still processing earlier ones
+    
+    Each request for height h schedules a background batch fetch of the next
+    ``lookahead`` heights, so a caller walking the chain in order finds the
+    following blocks already downloaded.
+    """
+    
+    def __init__(self, blockchain, lookahead: int = 8, verbosity: int = 1):
+        if lookahead < 1:
+            raise ValueError("lookahead must be at least 1")
+        
+        self.blockchain = blockchain
+        self.lookahead = lookahead
+        self.verbosity = verbosity
+        self.logger = logging.getLogger(__name__)
+        
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="block-prefetch")
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+    
+    def _fetch_range(self, heights: List[int]) -> Dict[int, Union[str, Dict[str, Any]]]:
+        """Fetch a run of blocks with two batch requests (hashes, then blocks)"""
+        block_hashes = self.blockchain.get_block_hashes_batch(heights)
+        blocks = self.blockchain.get_blocks_batch(block_hashes, self.verbosity)
+        return dict(zip(heights, blocks))
+    
+    def _schedule(self, start: int) -> None:
+        """Queue a background fetch for heights not yet pending from start onwards"""
+        with self._lock:
+            # Drop prefetched heights the caller has moved past
+            for height in [h for h in self._pending if h < start]:
+                del self._pending[height]
+            
+            # Refill only once half the window is consumed, so batches stay large
+            if start + self.lookahead // 2 in self._pending:
+                return
+            
+            missing = [h for h in range(start, start + self.lookahead) if h not in self._pending]
+            
+            self.logger.debug("Prefetching blocks %s-%s", missing[0], missing[-1])
+            future = self._executor.submit(self._fetch_range, missing)
+            for height in missing:
+                self._pending[height] = future
+    
+    def get_block_by_height(self, height: int) -> Union[str, Dict[str, Any]]:
+        """Get the block at height, prefetching the blocks that follow it"""
+        with self._lock:
+            future = self._pending.pop(height, None)
+        
+        self._schedule(height + 1)
+        
+        if future is not None:
+            try:
+                return future.result()[height]
+            except Exception as e:
+                # A failed batch (e.g. it ran past the tip) falls back to a direct fetch
+                self.logger.debug("Prefetch for block %s failed: %s", height, e)
+        
+        block_hash = self.blockchain.get_block_hash(height)
+        return self.blockchain.get_block(block_hash, self.verbosity)
+    
+    def close(self) -> None:
+        """Stop the background worker and discard pending prefetches"""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
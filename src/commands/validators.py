@@ -3,42 +3,82 @@ Validators for configuration and user input
 """
 
 import re
+import socket
 import ipaddress
 import hashlib
+from functools import lru_cache, wraps
 from typing import Union
 
 
+# Precompiled patterns shared by the validators below
+# Whole host name in one scan: dot-separated labels of 1-63 characters that
+# start and end with a letter, digit or underscore (Docker service names use
+# underscores). Each label's character class excludes '.', so there is a
+# single way to split the name and no backtracking between labels. The
+# 253-character limit and the digits-and-dots check live in is_valid_host.
+_HOST_LABEL = r'[A-Z\d_](?:[A-Z\d_-]{0,61}[A-Z\d_])?'
+_HOSTNAME = re.compile(rf'{_HOST_LABEL}(?:\.{_HOST_LABEL})*', re.IGNORECASE)
+_NUMERIC_HOST = re.compile(r'[\d.]+')
+_LEGACY_ADDR = re.compile(r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$')  # Legacy P2PKH and P2SH
+_BC1_ADDR = re.compile(r'^bc1[a-z0-9]{39,59}$')                  # Bech32 (P2WPKH and P2WSH)
+_TB1_ADDR = re.compile(r'^tb1[a-z0-9]{39,59}$')                  # Testnet Bech32
+_SAFE_PARAM = re.compile(r'[a-zA-Z0-9\-_./:]+')  # Used with fullmatch: '$' would allow a trailing newline
+
+# Parameter types passed through validate_json_rpc_params unchanged
+_PASSTHROUGH_PARAM_TYPES = frozenset((int, float, bool, type(None), list, dict))
+
+# Supported hash algorithms mapped straight to their hashlib constructors
+_HASH_CTORS = {
+    'sha1': hashlib.sha1,
+    'sha224': hashlib.sha224,
+    'sha256': hashlib.sha256,
+    'sha384': hashlib.sha384,
+    'sha512': hashlib.sha512,
+    'md5': hashlib.md5,
+    'blake2b': hashlib.blake2b,
+    'blake2s': hashlib.blake2s,
+}
+
+
 class ConfigValidator:
     """Validator for configuration values"""
     
+    __slots__ = ()
+    
     @staticmethod
     def is_valid_host(host: str) -> bool:
         """Validate host (IP address or hostname)"""
         if not host:
             return False
         
-        # Check if it's a valid IP address
+        # Check if it's a valid IP address (inet_pton is a C-level parse)
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
         try:
-            ipaddress.ip_address(host)
+            socket.inet_pton(family, host)
             return True
-        except ValueError:
+        except (OSError, ValueError):
             pass
         
-        # Check if it's a valid hostname
-        hostname_pattern = re.compile(
-            r'^(?!-)[A-Z\d-]{1,63}(?<!-)$', re.IGNORECASE
-        )
+        # Scoped IPv6 addresses (fe80::1%eth0) are not understood by inet_pton
+        if '%' in host:
+            try:
+                ipaddress.ip_address(host)
+                return True
+            except ValueError:
+                return False
         
-        # Split by dots and validate each part
-        parts = host.split('.')
-        if len(parts) > 1:  # FQDN
-            return all(hostname_pattern.match(part) for part in parts)
-        else:  # Single hostname
-            return hostname_pattern.match(host) is not None
+        # Names made only of digits and dots are malformed IPv4 addresses
+        if len(host) > 253 or _NUMERIC_HOST.fullmatch(host):
+            return False
+        
+        return _HOSTNAME.fullmatch(host) is not None
     
     @staticmethod
     def is_valid_port(port: Union[int, str]) -> bool:
         """Validate port number"""
+        # Ints (the common case) skip the conversion and exception handling
+        if type(port) is int:
+            return 1 <= port <= 65535
         try:
             port_num = int(port)
             return 1 <= port_num <= 65535
@@ -48,6 +88,8 @@ class ConfigValidator:
     @staticmethod
     def is_valid_timeout(timeout: Union[int, str]) -> bool:
         """Validate timeout value"""
+        if type(timeout) is int:
+            return 1 <= timeout <= 300
         try:
             timeout_num = int(timeout)
             return 1 <= timeout_num <= 300  # 1 second to 5 minutes
@@ -58,6 +100,20 @@ class ConfigValidator:
 class InputValidator:
     """Validator for user input parameters"""
     
+    __slots__ = ()
+    
+    @staticmethod
+    def _is_hex64(value: str) -> bool:
+        """Check for exactly 64 hex characters (32 bytes)"""
+        if len(value) != 64:
+            return False
+        
+        # bytes.fromhex skips whitespace, so also require the full 32 bytes
+        try:
+            return len(bytes.fromhex(value)) == 32
+        except ValueError:
+            return False
+    
     @staticmethod
     def is_valid_block_hash(block_hash: str) -> bool:
         """Validate Bitcoin block hash (64 character hex string)"""
@@ -65,8 +121,7 @@ class InputValidator:
             return False
         
         # Bitcoin block hashes are 64 character hex strings
-        hex_pattern = re.compile(r'^[0-9a-fA-F]{64}$')
-        return hex_pattern.match(block_hash) is not None
+        return InputValidator._is_hex64(block_hash)
     
     @staticmethod
     def is_valid_block_height(height: Union[int, str]) -> bool:
@@ -80,17 +135,17 @@ class InputValidator:
     @staticmethod
     def is_valid_bitcoin_address(address: str) -> bool:
         """Basic Bitcoin address validation (simplified)"""
-        if not isinstance(address, str):
+        if not isinstance(address, str) or len(address) < 26:
             return False
         
-        # Basic patterns for different address types
-        patterns = [
-            r'^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$',  # Legacy P2PKH and P2SH
-            r'^bc1[a-z0-9]{39,59}$',               # Bech32 (P2WPKH and P2WSH)
-            r'^tb1[a-z0-9]{39,59}$',               # Testnet Bech32
-        ]
-        
-        return any(re.match(pattern, address) for pattern in patterns)
+        # The prefix identifies the address type, so only one pattern can match
+        if address[0] in '13':
+            return _LEGACY_ADDR.match(address) is not None
+        if address.startswith('bc1'):
+            return _BC1_ADDR.match(address) is not None
+        if address.startswith('tb1'):
+            return _TB1_ADDR.match(address) is not None
+        return False
     
     @staticmethod
     def is_valid_transaction_id(txid: str) -> bool:
@@ -99,8 +154,7 @@ class InputValidator:
             return False
         
         # Transaction IDs are 64 character hex strings (like block hashes)
-        hex_pattern = re.compile(r'^[0-9a-fA-F]{64}$')
-        return hex_pattern.match(txid) is not None
+        return InputValidator._is_hex64(txid)
     
     @staticmethod
     def hash_with_sha512(data: str) -> str:
@@ -118,9 +172,7 @@ class InputValidator:
         
         # Remove potentially dangerous characters
         # Allow alphanumeric, common punctuation, but be restrictive
-        allowed_chars = re.compile(r'^[a-zA-Z0-9\-_./:]+$')
-        
-        if not allowed_chars.match(param):
+        if not _SAFE_PARAM.fullmatch(param):
             raise ValueError(f"Invalid characters in parameter: {param}")
         
         return param
@@ -129,23 +181,25 @@ class InputValidator:
     def validate_json_rpc_params(params: list) -> list:
         """Validate and sanitize JSON-RPC parameters"""
         validated_params = []
+        append = validated_params.append
+        sanitize = InputValidator.sanitize_rpc_param
         
         for param in params:
-            if isinstance(param, str):
+            param_type = type(param)
+            if param_type is str:
                 # For string parameters, apply basic sanitization
-                validated_params.append(InputValidator.sanitize_rpc_param(param))
-            elif isinstance(param, (int, float, bool)):
-                # Numeric and boolean parameters are safe
-                validated_params.append(param)
-            elif param is None:
-                # None values are acceptable
-                validated_params.append(param)
-            elif isinstance(param, (list, dict)):
-                # Complex types should be handled carefully
-                # For now, we'll allow them but could add recursive validation
-                validated_params.append(param)
+                append(sanitize(param))
+            elif param_type in _PASSTHROUGH_PARAM_TYPES:
+                # Numbers, booleans and None are safe; complex types are
+                # allowed for now but could get recursive validation
+                append(param)
+            elif isinstance(param, str):
+                # Subclasses miss the exact-type lookup above
+                append(sanitize(param))
+            elif isinstance(param, (int, float, list, dict)):
+                append(param)
             else:
-                raise ValueError(f"Unsupported parameter type: {type(param)}")
+                raise ValueError(f"Unsupported parameter type: {param_type}")
         
         return validated_params
 
@@ -153,27 +207,24 @@ class InputValidator:
 class CryptoValidator:
     """Cryptographic validators and utilities"""
     
+    __slots__ = ()
+    
     @staticmethod
     def verify_hash_algorithm(algorithm: str) -> bool:
         """Verify if hash algorithm is supported"""
-        supported_algorithms = [
-            'sha1', 'sha224', 'sha256', 'sha384', 'sha512',
-            'md5', 'blake2b', 'blake2s'
-        ]
-        return algorithm.lower() in supported_algorithms
+        return algorithm.lower() in _HASH_CTORS
     
     @staticmethod
     def hash_data(data: str, algorithm: str = 'sha512') -> str:
         """Hash data with specified algorithm"""
-        if not CryptoValidator.verify_hash_algorithm(algorithm):
+        hash_ctor = _HASH_CTORS.get(algorithm.lower())
+        if hash_ctor is None:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
         
         if not isinstance(data, str):
             data = str(data)
         
-        hash_obj = hashlib.new(algorithm.lower())
-        hash_obj.update(data.encode('utf-8'))
-        return hash_obj.hexdigest()
+        return hash_ctor(data.encode('utf-8')).hexdigest()
     
     @staticmethod
     def verify_ssl_certificate_path(cert_path: str) -> bool:
@@ -192,7 +243,28 @@ class CryptoValidator:
         return any(cert_path.lower().endswith(ext) for ext in valid_extensions)
 
 
+def _cached_validator(func):
+    """
+    Memoize a validator for string inputs
+    
+    Invalid values raise and are therefore never cached; non-string values
+    skip the cache so unhashable input still gets the validator's ValueError.
+    """
+    cached = lru_cache(maxsize=4096)(func)
+    
+    @wraps(func)
+    def wrapper(value):
+        if type(value) is not str:
+            return func(value)
+        return cached(value)
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 # Convenience functions for common validations
+@_cached_validator
 def validate_block_hash(block_hash: str) -> str:
     """Validate and return block hash, raise exception if invalid"""
     if not InputValidator.is_valid_block_hash(block_hash):
@@ -207,6 +279,7 @@ def validate_block_height(height: Union[int, str]) -> int:
     return int(height)
 
 
+@_cached_validator
 def validate_bitcoin_address(address: str) -> str:
     """Validate and return Bitcoin address, raise exception if invalid"""
     if not InputValidator.is_valid_bitcoin_address(address):
@@ -214,6 +287,7 @@ def validate_bitcoin_address(address: str) -> str:
     return address
 
 
+@_cached_validator
 def validate_transaction_id(txid: str) -> str:
     """Validate and return transaction ID, raise exception if invalid"""
     if not InputValidator.is_valid_transaction_id(txid):
@@ -3,6 +3,7 @@ Wallet-related Bitcoin RPC commands
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 from src.commands.validators import validate_bitcoin_address, validate_transaction_id
 
@@ -10,10 +11,25 @@ from src.commands.validators import validate_bitcoin_address, validate_transacti
 class WalletCommands:
     """Handler for wallet-related RPC commands"""
     
-    def __init__(self, rpc_client):
+    __slots__ = ('rpc_client', 'pool_size', 'logger')
+    
+    def __init__(self, rpc_client, pool_size: int = 8):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        
         self.rpc_client = rpc_client
+        self.pool_size = pool_size
         self.logger = logging.getLogger(__name__)
     
+    def _fan_out(self, method: str, params_list: List[List[Any]]) -> List[Any]:
+        """Issue the same RPC method concurrently for each params list, preserving order"""
+        if len(params_list) <= 1:
+            return [self.rpc_client.call(method, params) for params in params_list]
+        
+        workers = min(self.pool_size, len(params_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda params: self.rpc_client.call(method, params), params_list))
+    
     def get_wallet_info(self) -> Dict[str, Any]:
         """Get wallet information"""
         self.logger.debug("Executing getwalletinfo")
@@ -28,7 +44,7 @@ class WalletCommands:
             min_conf: Minimum confirmations
             include_watchonly: Include watchonly addresses
         """
-        self.logger.debug(f"Executing getbalance for account: {account}")
+        self.logger.debug("Executing getbalance for account: %s", account)
         
         # For newer Bitcoin Core versions, use simpler call
         try:
@@ -45,25 +61,36 @@ class WalletCommands:
             label: Label for the address
             address_type: Address type (legacy, p2sh-segwit, bech32)
         """
-        self.logger.debug(f"Executing getnewaddress with label: {label}")
+        self.logger.debug("Executing getnewaddress with label: %s", label)
         
-        params = []
-        if label:
-            params.append(label)
         if address_type:
-            if len(params) == 0:
-                params.append("")  # Empty label
-            params.append(address_type)
+            params = [label or "", address_type]
+        elif label:
+            params = [label]
+        else:
+            params = None
         
-        return self.rpc_client.call("getnewaddress", params if params else None)
+        return self.rpc_client.call("getnewaddress", params)
     
     def get_address_info(self, address: str) -> Dict[str, Any]:
         """Get information about an address"""
         validated_address = validate_bitcoin_address(address)
         
-        self.logger.debug(f"Executing getaddressinfo for: {validated_address}")
+        self.logger.debug("Executing getaddressinfo for: %s", validated_address)
         return self.rpc_client.call("getaddressinfo", [validated_address])
     
+    def get_address_info_many(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get information about many addresses concurrently
+        
+        Args:
+            addresses: Bitcoin addresses, results are returned in the same order
+        """
+        validated_addresses = [validate_bitcoin_address(addr) for addr in addresses]
+        
+        self.logger.debug("Executing getaddressinfo for %s addresses", len(validated_addresses))
+        return self._fan_out("getaddressinfo", [[addr] for addr in validated_addresses])
+    
     def list_addresses(self) -> List[Dict[str, Any]]:
         """List all addresses in the wallet"""
         self.logger.debug("Executing listaddresses")
@@ -79,7 +106,7 @@ class WalletCommands:
         """
         validated_address = validate_bitcoin_address(address)
         
-        self.logger.debug(f"Executing getreceivedbyaddress for: {validated_address}")
+        self.logger.debug("Executing getreceivedbyaddress for: %s", validated_address)
         return self.rpc_client.call("getreceivedbyaddress", [validated_address, min_conf])
     
     def list_transactions(self, account: str = "*", count: int = 10, skip: int = 0, include_watchonly: bool = False) -> List[Dict[str, Any]]:
@@ -92,7 +119,7 @@ class WalletCommands:
             skip: Number of transactions to skip
             include_watchonly: Include watchonly addresses
         """
-        self.logger.debug(f"Executing listtransactions, count: {count}, skip: {skip}")
+        self.logger.debug("Executing listtransactions, count: %s, skip: %s", count, skip)
         
         # For newer Bitcoin Core versions
         try:
@@ -111,7 +138,7 @@ class WalletCommands:
         """
         validated_txid = validate_transaction_id(txid)
         
-        self.logger.debug(f"Executing gettransaction for: {validated_txid}")
+        self.logger.debug("Executing gettransaction for: %s", validated_txid)
         return self.rpc_client.call("gettransaction", [validated_txid, include_watchonly])
     
     def send_to_address(self, address: str, amount: float, comment: str = "", comment_to: str = "", subtract_fee: bool = False) -> str:
@@ -130,18 +157,16 @@ class WalletCommands:
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        self.logger.debug(f"Executing sendtoaddress to: {validated_address}, amount: {amount}")
+        self.logger.debug("Executing sendtoaddress to: %s, amount: %s", validated_address, amount)
         
+        # Positional RPC arguments: an empty comment is sent only as a
+        # placeholder for a later argument, otherwise the node's default applies
         params = [validated_address, amount]
-        if comment:
-            params.append(comment)
-        if comment_to:
-            if len(params) == 2:
-                params.append("")  # Empty comment
-            params.append(comment_to)
+        if comment or comment_to or subtract_fee:
+            params.append(comment or "")
+        if comment_to or subtract_fee:
+            params.append(comment_to or "")
         if subtract_fee:
-            while len(params) < 4:
-                params.append("")
             params.append(subtract_fee)
         
         return self.rpc_client.call("sendtoaddress", params)
@@ -155,7 +180,7 @@ class WalletCommands:
             max_conf: Maximum confirmations
             addresses: Filter by addresses
         """
-        self.logger.debug(f"Executing listunspent, min_conf: {min_conf}, max_conf: {max_conf}")
+        self.logger.debug("Executing listunspent, min_conf: %s, max_conf: %s", min_conf, max_conf)
         
         params = [min_conf, max_conf]
         if addresses:
@@ -173,7 +198,7 @@ class WalletCommands:
             unlock: True to unlock, False to lock
             transactions: List of transaction outputs to lock/unlock
         """
-        self.logger.debug(f"Executing lockunspent, unlock: {unlock}")
+        self.logger.debug("Executing lockunspent, unlock: %s", unlock)
         
         params = [unlock]
         if transactions:
@@ -193,7 +218,7 @@ class WalletCommands:
         Args:
             destination: Backup file path
         """
-        self.logger.debug(f"Executing backupwallet to: {destination}")
+        self.logger.debug("Executing backupwallet to: %s", destination)
         return self.rpc_client.call("backupwallet", [destination])
     
     def encrypt_wallet(self, passphrase: str) -> str:
@@ -217,7 +242,7 @@ class WalletCommands:
             passphrase: Wallet passphrase
             timeout: Timeout in seconds
         """
-        self.logger.debug(f"Executing walletpassphrase, timeout: {timeout}")
+        self.logger.debug("Executing walletpassphrase, timeout: %s", timeout)
         return self.rpc_client.call("walletpassphrase", [passphrase, timeout])
     
     def wallet_lock(self) -> None:
@@ -2,11 +2,51 @@
 Configuration Management - Hybrid approach supporting .env, environment variables, and Docker secrets
 """
 
+import mmap
 import os
+import re
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from commands.validators import ConfigValidator
 
+# Default values for every non-secret setting
+DEFAULTS = {
+    'BITCOIN_RPC_HOST': '127.0.0.1',
+    'BITCOIN_RPC_PORT': '8332',
+    'BITCOIN_RPC_TIMEOUT': '30',
+    'BITCOIN_NETWORK': 'mainnet',
+    'BITCOIN_RPC_USE_SSL': 'false',
+    'BITCOIN_RPC_SSL_VERIFY': 'true',
+    'BITCOIN_RPC_SSL_CERT_PATH': '',
+    'LOG_LEVEL': 'INFO',
+    'LOG_FILE': 'bitcoin_wrapper.log'
+}
+
+# Environment variables a Config reads, settings and secrets alike
+CONFIG_ENV_VARS = tuple(DEFAULTS) + ('BITCOIN_RPC_USER', 'BITCOIN_RPC_PASSWORD')
+
+# Directory Docker mounts secrets into, one file per secret
+SECRETS_DIR = '/run/secrets'
+
+# Accepted LOG_LEVEL names and their logging module levels
+LOG_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+# One match per line of a .env file: a comment, KEY=value / KEY="value" /
+# KEY='value' (quotes are stripped from the value), or anything else, which
+# lands in the last group and is reported as invalid
+_ENV_LINE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'#.*'
+    r'|([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=[^\S\n]*(?:"([^"\n]*)"|\'([^\'\n]*)\'|(.*?))'
+    r'|(.*?)'
+    r')[^\S\n]*$',
+    re.MULTILINE
+)
+_ENV_LINE_BYTES = re.compile(_ENV_LINE.pattern.encode(), re.MULTILINE)
+
+# .env files at least this size are memory-mapped instead of read into a str
+ENV_MMAP_MIN_SIZE = 4096
+
 
 class Config:
     """Configuration manager with hybrid secret handling"""
@@ -14,6 +54,8 @@ class Config:
     def __init__(self, config_file: str = '.env'):
         self.config_file = config_file
         self.logger = logging.getLogger(__name__)
+        self._env_cache: Optional[Dict[str, str]] = None
+        self._secret_paths: Optional[Dict[str, str]] = None
         
         # Load configuration
         self._load_config()
@@ -22,31 +64,15 @@ class Config:
     def _load_config(self):
         """Load configuration from multiple sources (priority: env vars > docker secrets > .env file)"""
         
-        # Default values
-        defaults = {
-            'BITCOIN_RPC_HOST': '127.0.0.1',
-            'BITCOIN_RPC_PORT': '8332',
-            'BITCOIN_RPC_TIMEOUT': '30',
-            'BITCOIN_NETWORK': 'mainnet',
-            'BITCOIN_RPC_USE_SSL': 'false',
-            'BITCOIN_RPC_SSL_VERIFY': 'true',
-            'BITCOIN_RPC_SSL_CERT_PATH': '',
-            'LOG_LEVEL': 'INFO',
-            'LOG_FILE': 'bitcoin_wrapper.log'
-        }
-        
         # Start with defaults
-        config = defaults.copy()
+        config = DEFAULTS.copy()
         
         # Load from .env file if exists
-        env_config = self._load_env_file()
-        config.update(env_config)
+        config.update(self._env_config())
         
         # Override with environment variables
-        for key in defaults.keys():
-            env_value = os.getenv(key)
-            if env_value is not None:
-                config[key] = env_value
+        environ = os.environ
+        config.update({key: environ[key] for key in DEFAULTS if key in environ})
         
         # Handle Docker secrets (priority over everything)
         config['BITCOIN_RPC_USER'] = self._get_secret('BITCOIN_RPC_USER', 'bitcoin_rpc_user')
@@ -64,49 +90,87 @@ class Config:
         self.ssl_cert_path = config['BITCOIN_RPC_SSL_CERT_PATH'] or None
         self.log_level = config['LOG_LEVEL']
         self.log_file = config['LOG_FILE'] if config['LOG_FILE'] else None
+        
+        # Derived values read on every RPC call
+        scheme = 'https' if self.use_ssl else 'http'
+        self._rpc_url = f"{scheme}://{self.host}:{self.port}"
+        self._auth = (self.user, self.password)
+    
+    def _env_config(self) -> Dict[str, str]:
+        """Return the parsed .env file, reading it only once"""
+        if self._env_cache is None:
+            self._env_cache = self._load_env_file()
+        return self._env_cache
     
     def _load_env_file(self) -> Dict[str, str]:
         """Load configuration from .env file"""
         config = {}
         
-        if not os.path.exists(self.config_file):
+        try:
+            size = os.stat(self.config_file).st_size
+        except FileNotFoundError:
             self.logger.warning(f"Configuration file not found: {self.config_file}")
             return config
         
         try:
-            with open(self.config_file, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse key=value
-                    if '=' not in line:
-                        self.logger.warning(f"Invalid line {line_num} in {self.config_file}: {line}")
-                        continue
-                    
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    config[key] = value
+            if size < ENV_MMAP_MIN_SIZE:
+                with open(self.config_file, 'r') as f:
+                    self._parse_env(f.read(), _ENV_LINE, config)
+            else:
+                # Large files are scanned in place rather than copied into a str
+                with open(self.config_file, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        self._parse_env(data, _ENV_LINE_BYTES, config)
             
             self.logger.debug(f"Loaded configuration from {self.config_file}")
-            
+        
         except Exception as e:
             self.logger.error(f"Error loading configuration file {self.config_file}: {e}")
             raise
         
         return config
     
+    def _parse_env(self, data, pattern: re.Pattern, config: Dict[str, str]) -> None:
+        """
+        Parse .env data into config with a single regex pass
+        
+        Args:
+            data: File contents as str, or bytes-like for the bytes pattern
+            pattern: _ENV_LINE, or _ENV_LINE_BYTES for bytes-like data
+            config: Dictionary the parsed settings are added to
+        """
+        decode = pattern is _ENV_LINE_BYTES
+        
+        for match in pattern.finditer(data):
+            groups = match.groups()
+            if decode:
+                groups = [group if group is None else group.decode() for group in groups]
+            key, double_quoted, single_quoted, bare, invalid = groups
+            
+            if key is not None:
+                if double_quoted is not None:
+                    config[key] = double_quoted
+                elif single_quoted is not None:
+                    config[key] = single_quoted
+                else:
+                    config[key] = bare
+            elif invalid:
+                newline = b'\n' if decode else '\n'
+                line_num = data[:match.start()].count(newline) + 1
+                self.logger.warning(f"Invalid line {line_num} in {self.config_file}: {invalid}")
+    
+    def _secret_files(self) -> Dict[str, str]:
+        """Return the Docker secret files by name, listing the directory only once"""
+        if self._secret_paths is None:
+            try:
+                self._secret_paths = {entry.name: entry.path for entry in os.scandir(SECRETS_DIR)}
+            except FileNotFoundError:
+                self._secret_paths = {}
+            except OSError as e:
+                self.logger.warning(f"Error listing Docker secrets in {SECRETS_DIR}: {e}")
+                self._secret_paths = {}
+        return self._secret_paths
+    
     def _get_secret(self, env_var: str, secret_name: str) -> Optional[str]:
         """Get secret from environment variable, Docker secret, or .env file"""
         
@@ -117,8 +181,8 @@ class Config:
             return value
         
         # 2. Check Docker secret
-        secret_path = f"/run/secrets/{secret_name}"
-        if os.path.exists(secret_path):
+        secret_path = self._secret_files().get(secret_name)
+        if secret_path is not None:
             try:
                 with open(secret_path, 'r') as f:
                     value = f.read().strip()
@@ -128,8 +192,7 @@ class Config:
                 self.logger.warning(f"Error reading Docker secret {secret_path}: {e}")
         
         # 3. Check .env file
-        env_config = self._load_env_file()
-        value = env_config.get(env_var)
+        value = self._env_config().get(env_var)
         if value:
             self.logger.debug(f"Using .env file for {env_var}")
             return value
@@ -166,22 +229,20 @@ class Config:
             raise ValueError(f"SSL certificate file not found: {self.ssl_cert_path}")
         
         # Validate log level
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.log_level.upper() not in valid_log_levels:
-            raise ValueError(f"Invalid log level: {self.log_level}. Must be one of: {valid_log_levels}")
+        if self.log_level.upper() not in LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {self.log_level}. Must be one of: {list(LOG_LEVELS)}")
         
         self.logger.info("Configuration validation successful")
     
     @property
     def rpc_url(self) -> str:
         """Get the full RPC URL"""
-        scheme = 'https' if self.use_ssl else 'http'
-        return f"{scheme}://{self.host}:{self.port}"
+        return self._rpc_url
     
     @property
     def auth(self) -> tuple:
         """Get authentication tuple"""
-        return (self.user, self.password)
+        return self._auth
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary (excluding sensitive data)"""
@@ -202,3 +263,39 @@ class Config:
         """String representation (safe for logging)"""
         safe_config = self.to_dict()
         return f"BitcoinConfig({safe_config})"
+
+
+# Loaded configurations per absolute file path, with the file mtime and
+# CONFIG_ENV_VARS values they were read with
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[Optional[int], Tuple[Optional[str], ...]], Config]] = {}
+
+
+def get_config(config_file: str = '.env') -> Config:
+    """
+    Return a process-wide Config for config_file, loading it only once
+    
+    The cached instance is replaced when the file's modification time or
+    one of the CONFIG_ENV_VARS changes. Docker secrets are read only when
+    the configuration is (re)loaded.
+    """
+    path = os.path.abspath(config_file)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    
+    environ = os.environ
+    key = (mtime, tuple(environ.get(name) for name in CONFIG_ENV_VARS))
+    
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    config = Config(config_file)
+    _CONFIG_CACHE[path] = (key, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Forget every configuration loaded by get_config()"""
+    _CONFIG_CACHE.clear()
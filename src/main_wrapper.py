@@ -4,20 +4,26 @@ Bitcoin CLI Wrapper - Main Entry Point
 Secure Bitcoin RPC client with CLI interface
 """
 
-import argparse
+import importlib
 import json
 import sys
 import logging
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'lib'))
 
-from config import Config
-from rpc_client import BitcoinRPCClient
-from src.commands.blockchain import BlockchainCommands
-from src.commands.wallet import WalletCommands
-from src.commands.network import NetworkCommands
+from config import LOG_LEVELS, get_config
+from rpc_client import BitcoinRPCClient, BitcoinRPCError
+from src.commands.validators import InputValidator
+
+# orjson encodes straight to bytes, skipping the str build and re-encode
+# for large results (getblock with full transactions)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Command mapping - easily extensible
 COMMAND_MAP = {
@@ -39,16 +45,102 @@ COMMAND_MAP = {
     'getnewaddress': ('wallet', 'get_new_address'),
 }
 
+# Command handler classes as (import path, class name); a module is only
+# imported once one of its commands runs
 COMMAND_MODULES = {
-    'blockchain': BlockchainCommands,
-    'wallet': WalletCommands,
-    'network': NetworkCommands,
+    'blockchain': ('src.commands.blockchain', 'BlockchainCommands'),
+    'wallet': ('src.commands.wallet', 'WalletCommands'),
+    'network': ('src.commands.network', 'NetworkCommands'),
 }
 
 
-def setup_logging(config):
-    """Setup logging based on configuration"""
-    log_level = getattr(logging, config.log_level.upper())
+def write_json(result, sort_keys=True):
+    """Write result to stdout as indented JSON"""
+    if orjson is None:
+        print(json.dumps(result, indent=2, sort_keys=sort_keys))
+        return
+    
+    option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    out = orjson.dumps(result, option=option)
+    # Replaced streams (StringIO, some test runners) have no byte buffer
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        print(out.decode())
+        return
+    
+    sys.stdout.flush()
+    buffer.write(out + b'\n')
+    buffer.flush()
+
+
+class PrevalidatedClient:
+    """RPC client view for handlers whose CLI parameters were validated up front"""
+    
+    __slots__ = ('_client',)
+    
+    def __init__(self, rpc_client):
+        self._client = rpc_client
+    
+    def call(self, method, params=None):
+        return self._client.call(method, params, skip_validation=True)
+    
+    def batch_call(self, calls):
+        return self._client.batch_call(calls, skip_validation=True)
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def load_command_module(module_name):
+    """Import and return the handler class registered under module_name"""
+    import_path, class_name = COMMAND_MODULES[module_name]
+    return getattr(importlib.import_module(import_path), class_name)
+
+
+class BoundCommands(dict):
+    """
+    COMMAND_MAP entries bound to handler methods for one client
+    
+    Commands are resolved on first lookup, so only the modules that are
+    actually used get imported. Each module's handler is created once.
+    """
+    
+    def __init__(self, rpc_client):
+        super().__init__()
+        self._client = PrevalidatedClient(rpc_client)
+        self._handlers = {}
+    
+    def __missing__(self, command):
+        module_name, method_name = COMMAND_MAP[command]
+        
+        if module_name not in COMMAND_MODULES:
+            # No handler class registered; execute_command reports it as unimplemented
+            self[command] = None
+            return None
+        
+        handler = self._handlers.get(module_name)
+        if handler is None:
+            handler = load_command_module(module_name)(self._client)
+            self._handlers[module_name] = handler
+        
+        method = getattr(handler, method_name, None)
+        self[command] = method
+        return method
+
+
+def bind_commands(rpc_client):
+    """
+    Bind COMMAND_MAP entries to handler methods, one handler per module
+    
+    The handlers skip per-call parameter validation, so the bound methods
+    must only be called through execute_command, which validates once.
+    """
+    return BoundCommands(rpc_client)
+
+
+def setup_logging(config, verbose=False):
+    """Setup logging based on configuration, forcing DEBUG when verbose"""
+    log_level = logging.DEBUG if verbose else LOG_LEVELS[config.log_level.upper()]
     
     # Create formatter
     formatter = logging.Formatter(
@@ -73,6 +165,8 @@ def setup_logging(config):
 
 def create_parser():
     """Create argument parser"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Bitcoin CLI Wrapper - Secure RPC client',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -114,6 +208,12 @@ Examples:
         help='Configuration file path (default: .env)'
     )
     
+    parser.add_argument(
+        '--check-connection',
+        action='store_true',
+        help='Probe the node with getblockchaininfo before running the command'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -123,8 +223,61 @@ Examples:
     return parser
 
 
-def execute_command(rpc_client, command, params):
-    """Execute a Bitcoin RPC command"""
+def parse_args(argv=None):
+    """
+    Parse the command line without argparse for the common forms
+    
+    Handles ``[--config PATH] [--check-connection] [--verbose|-v] command
+    [params...]`` with the options before or after the command and its
+    parameters. Anything else (--help, unknown or abbreviated options,
+    negative numbers, an option between parameters, a --config value that
+    looks like an option, no command) goes through create_parser() so usage
+    and error messages stay the same.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = SimpleNamespace(config='.env', check_connection=False, verbose=False)
+    positional = []
+    # argparse takes command and params as one contiguous run of arguments
+    positional_done = False
+    
+    arg_iter = iter(argv)
+    for arg in arg_iter:
+        if arg in ('--verbose', '-v'):
+            args.verbose = True
+        elif arg == '--check-connection':
+            args.check_connection = True
+        elif arg == '--config':
+            args.config = next(arg_iter, None)
+            if args.config is None or args.config.startswith('-'):
+                return create_parser().parse_args(argv)
+        elif arg.startswith('-') or positional_done:
+            return create_parser().parse_args(argv)
+        else:
+            positional.append(arg)
+            continue
+        positional_done = bool(positional)
+    
+    if not positional:
+        return create_parser().parse_args(argv)
+    
+    args.command = positional[0]
+    args.params = positional[1:]
+    return args
+
+
+def execute_command(rpc_client, command, params, commands=None):
+    """
+    Execute a Bitcoin RPC command
+    
+    Args:
+        rpc_client: Connected BitcoinRPCClient
+        command: CLI command name from COMMAND_MAP
+        params: Positional parameters for the command
+        commands: Result of bind_commands(rpc_client); pass it when running
+            many commands on one client to skip re-resolving handlers
+    """
     logger = logging.getLogger(__name__)
     
     if command not in COMMAND_MAP:
@@ -135,15 +288,20 @@ def execute_command(rpc_client, command, params):
             "error_code": "UNKNOWN_COMMAND"
         }
     
-    module_name, method_name = COMMAND_MAP[command]
+    if commands is None:
+        commands = bind_commands(rpc_client)
     
     try:
-        # Get the command module
-        module_class = COMMAND_MODULES[module_name]
-        command_handler = module_class(rpc_client)
+        # Get the bound command method
+        method = commands[command]
+        if method is None:
+            raise AttributeError(f"{COMMAND_MAP[command][1]} is not implemented")
         
-        # Get the method
-        method = getattr(command_handler, method_name)
+        # Validate the CLI parameters once; the bound handlers skip re-validation
+        try:
+            params = InputValidator.validate_json_rpc_params(params)
+        except ValueError as e:
+            raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
         
         # Execute the command
         logger.info(f"Executing command: {command} with params: {params}")
@@ -156,7 +314,7 @@ def execute_command(rpc_client, command, params):
             "command": command,
             "params": params
         }
-        
+    
     except AttributeError as e:
         logger.error(f"Command method not found: {e}")
         return {
@@ -179,19 +337,15 @@ def execute_command(rpc_client, command, params):
 
 def main():
     """Main entry point"""
-    parser = create_parser()
-    args = parser.parse_args()
+    args = parse_args()
     
     try:
         # Load configuration
-        config = Config(args.config)
-        
-        # Override log level if verbose
-        if args.verbose:
-            config.log_level = 'DEBUG'
+        config = get_config(args.config)
         
-        # Setup logging
-        setup_logging(config)
+        # Setup logging; --verbose overrides the level without touching the
+        # cached config shared with other callers
+        setup_logging(config, verbose=args.verbose)
         logger = logging.getLogger(__name__)
         
         logger.info("Bitcoin CLI Wrapper starting...")
@@ -200,20 +354,22 @@ def main():
         # Create RPC client
         rpc_client = BitcoinRPCClient(config)
         
-        # Test connection
-        logger.debug("Testing RPC connection...")
-        rpc_client.test_connection()
-        logger.info("RPC connection successful")
+        # Connection problems surface from the command itself unless a
+        # preflight probe is requested, saving a round-trip per invocation
+        if args.check_connection:
+            logger.debug("Testing RPC connection...")
+            rpc_client.test_connection()
+            logger.info("RPC connection successful")
         
         # Execute command
         result = execute_command(rpc_client, args.command, args.params)
         
         # Output result as JSON
-        print(json.dumps(result, indent=2, sort_keys=True))
+        write_json(result)
         
         # Exit with appropriate code
         sys.exit(0 if result.get("success", False) else 1)
-        
+    
     except Exception as e:
         # Handle fatal errors
         error_result = {
@@ -221,7 +377,7 @@ def main():
             "error": str(e),
             "error_code": "FATAL_ERROR"
         }
-        print(json.dumps(error_result, indent=2))
+        write_json(error_result, sort_keys=False)
         sys.exit(1)
 
 
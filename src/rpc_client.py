@@ -2,27 +2,93 @@
 Secure Bitcoin RPC Client with SSL support, connection pooling, and robust error handling
 """
 
+import base64
+import itertools
 import json
 import logging
+import os
 import requests
 import time
-from typing import Any, Dict, List, Optional
+import urllib3
+from typing import Any, Dict, List, Optional, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from urllib3.exceptions import InsecureRequestWarning
 
 from commands.validators import InputValidator
 
+# orjson parses large RPC responses (getblock verbosity 2, listtransactions)
+# and serializes request bodies several times faster; fall back to the
+# standard library when missing. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a request body compactly to UTF-8 bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Headers sent with every request; each client adds its own Authorization
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'Bitcoin-CLI-Wrapper/1.0',
+    'Connection': 'keep-alive'
+}
+
+# Messages for HTTP statuses with a known cause; others report the status and body
+HTTP_ERROR_MESSAGES = {
+    401: "Authentication failed",
+    403: "Access forbidden",
+    404: "RPC endpoint not found",
+}
+
+# RPCs without side effects, which are safe to resend after a transient failure.
+# Everything else (sends, wallet and node changes, getnewaddress) goes out once.
+READ_ONLY_METHODS = frozenset({
+    'getaddednodeinfo', 'getaddressinfo', 'getbalance', 'getbestblockhash',
+    'getblock', 'getblockchaininfo', 'getblockcount', 'getblockhash',
+    'getblockheader', 'getblocktemplate', 'getchaintips', 'getconnectioncount',
+    'getdifficulty', 'getmempoolinfo', 'getmininginfo', 'getnettotals',
+    'getnetworkinfo', 'getnodeaddresses', 'getpeerinfo', 'getrawmempool',
+    'getreceivedbyaddress', 'gettransaction', 'gettxoutsetinfo', 'getwalletinfo',
+    'listaddresses', 'listbanned', 'listlockunspent', 'listtransactions',
+    'listunspent',
+})
+
+# Retries for read-only RPCs: attempts in total, first backoff delay (doubled
+# per retry) and the HTTP statuses treated as transient
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def basic_auth_header(user: str, password: str) -> str:
+    """Build the HTTP Basic Authorization header value for the RPC credentials"""
+    credentials = base64.b64encode(f"{user}:{password}".encode('utf-8')).decode('ascii')
+    return f"Basic {credentials}"
+
 
 class BitcoinRPCError(Exception):
     """Custom exception for Bitcoin RPC errors"""
     
+    # BaseException still provides a __dict__, but these live in slots
+    __slots__ = ('message', 'code', 'data')
+    
     def __init__(self, message: str, code: Optional[int] = None, data: Optional[Any] = None):
         super().__init__(message)
         self.code = code
         self.data = data
         self.message = message
     
+    def __reduce__(self):
+        # Slot values are not part of the pickled __dict__, so pass them as arguments
+        return (type(self), (self.message, self.code, self.data))
+    
     def __str__(self):
         return f"Bitcoin RPC Error {self.code}: {self.message}"
 
@@ -30,61 +96,76 @@ class BitcoinRPCError(Exception):
 class BitcoinRPCClient:
     """Secure Bitcoin RPC client with enterprise features"""
     
-    def __init__(self, config):
+    def __init__(self, config, pool_size: int = 20):
         self.config = config
+        self.pool_size = pool_size
         self.logger = logging.getLogger(__name__)
-        self.session = None
-        self._setup_session()
+        # Serialized '{"jsonrpc":"2.0","method":...,"params":' per method name
+        self._prefix_cache: Dict[str, bytes] = {}
+        # Request ids only need to be unique within this client; next() on a
+        # count is atomic, so threads sharing the client never reuse an id
+        self._req_ids = itertools.count(1)
+        
+        # The HTTP session is created on first use, see the session property
+        self._session = None
+        self._closed = False
+    
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """HTTP session, created on first access; None once the client is closed"""
+        if self._session is None and not self._closed:
+            self._setup_session()
+        return self._session
     
     def _setup_session(self):
         """Setup HTTP session with connection pooling and retry strategy"""
-        self.session = requests.Session()
-        
-        # Setup authentication
-        self.session.auth = self.config.auth
-        
-        # Setup headers
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'Bitcoin-CLI-Wrapper/1.0',
-            'Connection': 'keep-alive'
-        })
-        
-        # Setup retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST"]  # Only retry POST requests
-        )
+        session = requests.Session()
+        
+        # Setup headers; credentials are static, so the Authorization header is
+        # built once instead of by an auth handler on every request
+        session.headers.update(DEFAULT_HEADERS, Authorization=basic_auth_header(*self.config.auth))
+        
+        # Only re-establish failed connections here; a POST that reached the node
+        # is never resent by urllib3 (read-only RPCs are retried in _send)
+        retry_strategy = Retry(total=1, backoff_factor=0)
         
+        # One keep-alive connection per concurrent caller, all to the same node
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
+            pool_connections=1,
+            pool_maxsize=self.pool_size
         )
         
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         
         # SSL configuration
         if self.config.use_ssl:
             if not self.config.ssl_verify:
                 # Disable SSL warnings for self-signed certificates
-                requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+                urllib3.disable_warnings(InsecureRequestWarning)
                 self.logger.warning("SSL certificate verification disabled")
             
-            self.session.verify = self.config.ssl_verify
+            session.verify = self.config.ssl_verify
             
             if self.config.ssl_cert_path:
-                self.session.cert = self.config.ssl_cert_path
+                session.cert = self.config.ssl_cert_path
                 self.logger.info(f"Using SSL certificate: {self.config.ssl_cert_path}")
         
+        # Resolve proxy and CA bundle settings from the environment once here;
+        # with trust_env enabled requests re-reads them on every call
+        session.proxies.update(requests.utils.get_environ_proxies(self.config.rpc_url))
+        ca_bundle = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+        if ca_bundle and session.verify is True:
+            session.verify = ca_bundle
+        session.trust_env = False
+        
+        self._session = session
         self.logger.debug("HTTP session configured successfully")
     
     def _create_request(self, method: str, params: List[Any] = None) -> Dict[str, Any]:
         """Create JSON-RPC request"""
-        request_id = int(time.time() * 1000000)  # Microsecond timestamp as ID
+        request_id = next(self._req_ids)
         
         request_data = {
             "jsonrpc": "2.0",
@@ -95,27 +176,44 @@ class BitcoinRPCClient:
         
         return request_data
     
+    def _encode_request(self, method: str, params: List[Any] = None) -> bytes:
+        """Serialize a JSON-RPC request, reusing the constant envelope for each method"""
+        prefix = self._prefix_cache.get(method)
+        if prefix is None:
+            prefix = b'{"jsonrpc":"2.0","method":' + _json_dumps(method) + b',"params":'
+            self._prefix_cache[method] = prefix
+        
+        # Parameterless calls (getblockchaininfo, getblockcount, ...) need no encoding at all
+        params_json = _json_dumps(params) if params else b'[]'
+        return prefix + params_json + b',"id":%d}' % next(self._req_ids)
+    
     def _handle_response(self, response: requests.Response) -> Any:
         """Handle and validate RPC response"""
-        try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error: {e}")
-            if response.status_code == 401:
-                raise BitcoinRPCError("Authentication failed", -1)
-            elif response.status_code == 403:
-                raise BitcoinRPCError("Access forbidden", -1)
-            elif response.status_code == 404:
-                raise BitcoinRPCError("RPC endpoint not found", -1)
-            else:
-                raise BitcoinRPCError(f"HTTP {response.status_code}: {response.text}", -1)
+        return self._extract_result(self._parse_response(response))
+    
+    def _parse_response(self, response: requests.Response) -> Any:
+        """Check HTTP status and decode the JSON body of an RPC response"""
+        # Nearly every response is a 200; only build HTTP errors off that path
+        if response.status_code != 200:
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                self.logger.error(f"HTTP error: {e}")
+                message = HTTP_ERROR_MESSAGES.get(response.status_code)
+                if message is None:
+                    message = f"HTTP {response.status_code}: {response.text}"
+                raise BitcoinRPCError(message, -1)
         
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON response: {e}")
             raise BitcoinRPCError(f"Invalid JSON response: {response.text}", -32700)
         
+        return data
+    
+    def _extract_result(self, data: Dict[str, Any]) -> Any:
+        """Return the result of a single JSON-RPC response object"""
         # Handle JSON-RPC error response
         if "error" in data and data["error"] is not None:
             error = data["error"]
@@ -128,33 +226,133 @@ class BitcoinRPCClient:
         # Return the result
         return data.get("result")
     
-    def call(self, method: str, params: List[Any] = None) -> Any:
-        """Make RPC call to Bitcoin node"""
+    def call(self, method: str, params: List[Any] = None, skip_validation: bool = False) -> Any:
+        """
+        Make RPC call to Bitcoin node
+        
+        Args:
+            method: RPC method name
+            params: Positional parameters
+            skip_validation: Skip InputValidator checks for params that were
+                already validated by the caller
+        """
         if not self.session:
             raise BitcoinRPCError("RPC client not initialized", -1)
         
         # Validate and sanitize parameters
-        if params:
+        if params and not skip_validation:
             try:
                 params = InputValidator.validate_json_rpc_params(params)
             except ValueError as e:
                 raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
         
-        # Create request
-        request_data = self._create_request(method, params)
+        # Create request; params that cannot be serialized are a caller error
+        # (orjson.JSONEncodeError subclasses TypeError)
+        try:
+            body = self._encode_request(method, params)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
+        
+        self.logger.debug("RPC call: %s with params: %s", method, params)
+        
+        result = self._post(body, retry=method in READ_ONLY_METHODS)
+        self.logger.debug("RPC call successful: %s", method)
+        return result
+    
+    def batch_call(self, calls: List[Tuple[str, List[Any]]], skip_validation: bool = False) -> List[Any]:
+        """
+        Make several RPC calls in a single JSON-RPC batch request
         
-        self.logger.debug(f"RPC call: {method} with params: {params}")
+        Args:
+            calls: List of (method, params) tuples
+            skip_validation: Skip InputValidator checks, as for call()
+        
+        Returns:
+            Results in the same order as ``calls``. The first error found in
+            the batch is raised as a BitcoinRPCError.
+        """
+        if not self.session:
+            raise BitcoinRPCError("RPC client not initialized", -1)
+        
+        if not calls:
+            return []
+        
+        payload = []
+        for request_id, (method, params) in enumerate(calls):
+            if params and not skip_validation:
+                try:
+                    params = InputValidator.validate_json_rpc_params(params)
+                except ValueError as e:
+                    raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
+            
+            request_data = self._create_request(method, params)
+            request_data["id"] = request_id
+            payload.append(request_data)
+        
+        self.logger.debug("RPC batch call with %s requests", len(payload))
         
         try:
-            response = self.session.post(
-                self.config.rpc_url,
-                json=request_data,
-                timeout=self.config.timeout
-            )
+            body = _json_dumps(payload)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise BitcoinRPCError(f"Invalid parameters: {e}", -32602)
+        
+        retry = all(method in READ_ONLY_METHODS for method, _ in calls)
+        results = self._post(body, batch_size=len(payload), retry=retry)
+        self.logger.debug("RPC batch call successful: %s results", len(results))
+        return results
+    
+    def _send(self, body: bytes, retry: bool) -> requests.Response:
+        """POST a request body, retrying dropped connections and overload statuses when retry is set"""
+        attempts = RETRY_ATTEMPTS if retry else 1
+        
+        for attempt in range(1, attempts + 1):
+            try:
+                response = self.session.post(
+                    self.config.rpc_url,
+                    data=body,
+                    timeout=self.config.timeout
+                )
+            except requests.exceptions.ConnectionError:
+                if attempt == attempts:
+                    raise
+            else:
+                if attempt == attempts or response.status_code not in RETRY_STATUSES:
+                    return response
+            
+            delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+            self.logger.debug("Retrying RPC request in %ss (attempt %s of %s)", delay, attempt + 1, attempts)
+            time.sleep(delay)
+    
+    def _post(self, body: bytes, batch_size: Optional[int] = None, retry: bool = False) -> Any:
+        """Send a serialized JSON-RPC request (or batch of batch_size) and return the result(s)"""
+        try:
+            response = self._send(body, retry)
+            
+            if batch_size is None:
+                return self._handle_response(response)
+            
+            data = self._parse_response(response)
+            if not isinstance(data, list):
+                # A batch rejected as a whole yields a single error object
+                self._extract_result(data)
+                raise BitcoinRPCError("Invalid batch response", -32603)
             
-            result = self._handle_response(response)
-            self.logger.debug(f"RPC call successful: {method}")
-            return result
+            if len(data) != batch_size:
+                raise BitcoinRPCError(
+                    f"Batch response size mismatch: expected {batch_size}, got {len(data)}",
+                    -32603
+                )
+            
+            # Entries may come back in any order; each request id must be
+            # answered exactly once (requests are numbered 0..batch_size-1)
+            by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+            if len(by_id) != batch_size or not all(i in by_id for i in range(batch_size)):
+                raise BitcoinRPCError(
+                    f"Batch response ids do not match request ids 0..{batch_size - 1}",
+                    -32603
+                )
+            
+            return [self._extract_result(by_id[i]) for i in range(batch_size)]
             
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"Connection error: {e}")
@@ -190,8 +388,11 @@ class BitcoinRPCClient:
     def get_node_info(self) -> Dict[str, Any]:
         """Get basic node information for diagnostics"""
         try:
-            blockchain_info = self.call("getblockchaininfo")
-            network_info = self.call("getnetworkinfo")
+            # One round-trip for both RPCs
+            blockchain_info, network_info = self.batch_call([
+                ("getblockchaininfo", []),
+                ("getnetworkinfo", [])
+            ])
             
             return {
                 "chain": blockchain_info.get("chain"),
@@ -206,9 +407,10 @@ class BitcoinRPCClient:
     
     def close(self):
         """Close the HTTP session"""
-        if self.session:
-            self.session.close()
-            self.session = None
+        self._closed = True
+        if self._session:
+            self._session.close()
+            self._session = None
             self.logger.debug("RPC session closed")
     
     def __enter__(self):
@@ -217,8 +419,4 @@ class BitcoinRPCClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.close()
-    
-    def __del__(self):
-        """Destructor to ensure session is closed"""
         self.close()
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from config import clear_config_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    """Start every test without configurations cached by get_config()"""
+    clear_config_cache()
+    yield
+    clear_config_cache()
@@ -0,0 +1,249 @@
+"""
+Test suite for the asynchronous Bitcoin RPC client
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+import os
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+aiohttp = pytest.importorskip("aiohttp")
+
+import async_rpc_client
+from async_rpc_client import AsyncBitcoinRPCClient
+from rpc_client import BitcoinRPCError
+from src.commands.async_blockchain import AsyncBlockchainCommands
+from test_rpc_client import MockConfig
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse"""
+    
+    def __init__(self, body, status=200):
+        self.status = status
+        self._text = body if isinstance(body, str) else json.dumps(body)
+    
+    async def text(self):
+        return self._text
+    
+    async def read(self):
+        return self._text.encode()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """Records posted payloads and answers each one through a responder callable"""
+    
+    def __init__(self, responder):
+        self.responder = responder
+        self.posts = []
+    
+    def post(self, url, data=None):
+        payload = json.loads(data)
+        self.posts.append(payload)
+        return self.responder(payload)
+    
+    async def close(self):
+        pass
+
+
+def make_client(responder):
+    client = AsyncBitcoinRPCClient(MockConfig())
+    client.session = FakeSession(responder)
+    return client
+
+
+class TestAsyncBitcoinRPCClient:
+    """Test asynchronous RPC client functionality"""
+    
+    def test_successful_call(self):
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": {"blocks": 100}, "error": None}))
+        
+        result = asyncio.run(client.call("getblockchaininfo"))
+        
+        assert result == {"blocks": 100}
+        assert client.session.posts[0]['method'] == 'getblockchaininfo'
+        assert client.session.posts[0]['params'] == []
+    
+    def test_rpc_error(self):
+        client = make_client(lambda payload: FakeResponse(
+            {"id": 1, "result": None, "error": {"code": -5, "message": "Block not found"}}
+        ))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblock", ["nonexistent_hash"]))
+        
+        assert exc_info.value.code == -5
+        assert "Block not found" in str(exc_info.value)
+    
+    def test_http_error(self):
+        client = make_client(lambda payload: FakeResponse("Unauthorized", status=401))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblockchaininfo"))
+        
+        assert "Authentication failed" in str(exc_info.value)
+    
+    @pytest.mark.parametrize("body", [[1, 2], '"ok"', 5, None])
+    def test_non_object_response(self, body):
+        client = make_client(lambda payload: FakeResponse(body))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblockcount"))
+        
+        assert exc_info.value.code == -32603
+    
+    def test_non_object_error(self):
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": None, "error": "boom"}))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblockcount"))
+        
+        assert "boom" in str(exc_info.value)
+    
+    @pytest.mark.parametrize("exc, message", [
+        (aiohttp.ServerTimeoutError("read timeout"), "Request timeout"),
+        (asyncio.TimeoutError(), "Request timeout"),
+        (aiohttp.ClientConnectionError("refused"), "Cannot connect"),
+        (aiohttp.ClientPayloadError("truncated"), "Request failed"),
+    ])
+    def test_transport_errors(self, exc, message):
+        def responder(payload):
+            raise exc
+        client = make_client(responder)
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblockcount"))
+        
+        assert message in str(exc_info.value)
+    
+    def test_parameter_validation(self):
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": None, "error": None}))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblock", ["invalid;chars"]))
+        
+        assert exc_info.value.code == -32602
+        assert client.session.posts == []
+    
+    def test_concurrent_fan_out(self):
+        """Test that gathered commands each get their own answer"""
+        client = make_client(lambda payload: FakeResponse(
+            {"id": payload['id'], "result": f"hash{payload['params'][0]}", "error": None}
+        ))
+        commands = AsyncBlockchainCommands(client)
+        
+        async def fetch():
+            return await asyncio.gather(*(commands.get_block_hash(h) for h in range(5)))
+        
+        assert asyncio.run(fetch()) == [f"hash{h}" for h in range(5)]
+        assert len(client.session.posts) == 5
+    
+    def test_gather(self):
+        """Test independent calls run concurrently and come back in call order"""
+        calls = [("getblockcount", []), ("getblockhash", [1]), ("getbestblockhash", [])]
+        in_flight = []
+        all_sent = asyncio.Event()
+        
+        class BlockingResponse(FakeResponse):
+            """Holds its request open until every gathered request has been sent"""
+            
+            async def __aenter__(self):
+                in_flight.append(self)
+                if len(in_flight) == len(calls):
+                    all_sent.set()
+                # A sequential loop never gets past the first request
+                await asyncio.wait_for(all_sent.wait(), timeout=1)
+                return self
+        
+        client = make_client(lambda payload: BlockingResponse(
+            {"id": payload['id'], "result": [payload['method'], payload['params']], "error": None}
+        ))
+        
+        assert asyncio.run(client.gather(calls)) == [
+            ["getblockcount", []], ["getblockhash", [1]], ["getbestblockhash", []]
+        ]
+        assert len(in_flight) == 3
+        assert asyncio.run(client.gather([])) == []
+    
+    def test_context_manager(self):
+        """Test the aiohttp session is created on entry and closed on exit"""
+        client = AsyncBitcoinRPCClient(MockConfig())
+        
+        async def use_client():
+            async with client as c:
+                assert c.session is not None
+                assert c.session.connector.limit == 20
+        
+        asyncio.run(use_client())
+        assert client.session is None
+
+
+def stdlib_dumps(obj):
+    """Same compact encoding as rpc_client's fallback when orjson is missing"""
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """Run a test with orjson and with the standard library codec"""
+    if request.param == "orjson":
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(async_rpc_client, '_json_dumps', orjson.dumps)
+        monkeypatch.setattr(async_rpc_client, '_json_loads', orjson.loads)
+    else:
+        monkeypatch.setattr(async_rpc_client, '_json_dumps', stdlib_dumps)
+        monkeypatch.setattr(async_rpc_client, '_json_loads', json.loads)
+    return request.param
+
+
+class TestAsyncRequestEncoding:
+    """Test request bodies with each JSON codec"""
+    
+    def test_body_encoded(self, codec):
+        bodies = []
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": "ok", "error": None}))
+        post = client.session.post
+        client.session.post = lambda url, data=None: bodies.append(data) or post(url, data)
+        
+        assert asyncio.run(client.call("getblock", ["abc123", 2])) == "ok"
+        assert isinstance(bodies[0], bytes)
+        assert json.loads(bodies[0])["params"] == ["abc123", 2]
+        assert b' ' not in bodies[0]
+    
+    def test_unserializable_params(self, codec):
+        """Test params that cannot be encoded as JSON raise BitcoinRPCError before sending"""
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": None, "error": None}))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            asyncio.run(client.call("getblock", [{"txids": {1, 2}}]))
+        
+        assert exc_info.value.code == -32602
+        assert client.session.posts == []
+    
+    def test_integer_beyond_64_bits(self, codec):
+        client = make_client(lambda payload: FakeResponse({"id": 1, "result": "ok", "error": None}))
+        call = client.call("getblockhash", [2 ** 70])
+        
+        if codec == "orjson":
+            # orjson only encodes 64-bit integers
+            with pytest.raises(BitcoinRPCError) as exc_info:
+                asyncio.run(call)
+            assert exc_info.value.code == -32602
+            assert client.session.posts == []
+        else:
+            assert asyncio.run(call) == "ok"
+            assert client.session.posts[0]["params"] == [2 ** 70]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
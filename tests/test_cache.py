@@ -0,0 +1,144 @@
+"""
+Test suite for client-side RPC result caching
+"""
+
+import pytest
+import sys
+import os
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from unittest.mock import patch
+
+from src.commands.cache import ImmutableCache
+from src.commands.blockchain import BlockchainCommands, FINALITY_DEPTH, TIP_CACHE_TTL
+
+BLOCK_HASH = "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f"
+
+
+class RecordingRPCClient:
+    """Fake RPC client answering from a method -> result table and recording calls"""
+    
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+    
+    def call(self, method, params=None):
+        self.calls.append((method, params))
+        return self.results[method]
+
+
+class TestImmutableCache:
+    """Test the bounded LRU cache"""
+    
+    def test_get_and_put(self):
+        cache = ImmutableCache(maxsize=10)
+        
+        assert cache.get("missing") is None
+        
+        cache.put("key", "value")
+        assert cache.get("key") == "value"
+        assert len(cache) == 1
+        
+        cache.clear()
+        assert cache.get("key") is None
+    
+    def test_lru_eviction(self):
+        cache = ImmutableCache(maxsize=2)
+        
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ImmutableCache(maxsize=0)
+
+
+class TestBlockchainCaching:
+    """Test which BlockchainCommands results are served from the cache"""
+    
+    def test_raw_block_cached(self):
+        client = RecordingRPCClient({"getblock": "00ff"})
+        commands = BlockchainCommands(client)
+        
+        assert commands.get_block(BLOCK_HASH, 0) == "00ff"
+        assert commands.get_block(BLOCK_HASH, 0) == "00ff"
+        assert len(client.calls) == 1
+        
+        # Verbose blocks include confirmations, so they always go to the node
+        commands.get_block(BLOCK_HASH, 1)
+        commands.get_block(BLOCK_HASH, 1)
+        assert len(client.calls) == 3
+    
+    def test_raw_header_cached(self):
+        client = RecordingRPCClient({"getblockheader": "0100"})
+        commands = BlockchainCommands(client)
+        
+        commands.get_block_header(BLOCK_HASH, False)
+        commands.get_block_header(BLOCK_HASH, False)
+        assert len(client.calls) == 1
+        
+        commands.get_block_header(BLOCK_HASH, True)
+        assert len(client.calls) == 2
+    
+    def test_block_hash_cached_only_below_finality(self):
+        client = RecordingRPCClient({"getblockcount": 100, "getblockhash": BLOCK_HASH})
+        commands = BlockchainCommands(client)
+        
+        # Unknown tip: nothing is cached
+        commands.get_block_hash(10)
+        commands.get_block_hash(10)
+        assert client.calls.count(("getblockhash", [10])) == 2
+        
+        commands.get_block_count()
+        
+        deep = 100 - FINALITY_DEPTH
+        commands.get_block_hash(deep)
+        commands.get_block_hash(deep)
+        assert client.calls.count(("getblockhash", [deep])) == 1
+        
+        # Heights near the tip may still reorg
+        commands.get_block_hash(deep + 1)
+        commands.get_block_hash(deep + 1)
+        assert client.calls.count(("getblockhash", [deep + 1])) == 2
+    
+    def test_tip_results_cached_for_ttl(self):
+        client = RecordingRPCClient({
+            "getblockchaininfo": {"blocks": 100},
+            "getblockcount": 100,
+            "getchaintips": [{"height": 100}]
+        })
+        commands = BlockchainCommands(client)
+        
+        with patch('src.commands.cache.time.monotonic') as mock_time:
+            mock_time.return_value = 1000.0
+            assert commands.get_blockchain_info() == {"blocks": 100}
+            assert commands.get_block_count() == 100
+            assert commands.get_chain_tips() == [{"height": 100}]
+            
+            mock_time.return_value = 1000.0 + TIP_CACHE_TTL / 2
+            commands.get_blockchain_info()
+            commands.get_block_count()
+            commands.get_chain_tips()
+            assert len(client.calls) == 3
+            
+            mock_time.return_value = 1000.0 + TIP_CACHE_TTL
+            commands.get_blockchain_info()
+            commands.get_block_count()
+            commands.get_chain_tips()
+            assert len(client.calls) == 6
+        
+        # Each handler keeps its own cache
+        BlockchainCommands(client).get_block_count()
+        assert len(client.calls) == 7
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
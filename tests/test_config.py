@@ -3,116 +3,173 @@ Test suite for configuration management
 """
 
 import os
-import tempfile
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, mock_open
 import sys
 
 # Add lib directory to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
-from config import Config
-from validators import ConfigValidator
+from config import Config, ENV_MMAP_MIN_SIZE, get_config
+from validators import ConfigValidator, InputValidator, validate_block_hash
+
+
+# Validators are stateless, so one instance serves every case
+VALIDATOR = ConfigValidator()
 
 
 class TestConfigValidator:
     """Test configuration validators"""
     
-    def test_valid_hosts(self):
-        validator = ConfigValidator()
-        
+    @pytest.mark.parametrize("host", [
         # Valid IP addresses
-        assert validator.is_valid_host("127.0.0.1")
-        assert validator.is_valid_host("192.168.1.1")
-        assert validator.is_valid_host("::1")
-        assert validator.is_valid_host("2001:db8::1")
-        
+        "127.0.0.1",
+        "192.168.1.1",
+        "::1",
+        "2001:db8::1",
         # Valid hostnames
-        assert validator.is_valid_host("localhost")
-        assert validator.is_valid_host("bitcoin-node")
-        assert validator.is_valid_host("example.com")
-        assert validator.is_valid_host("bitcoin.example.com")
+        "localhost",
+        "bitcoin-node",
+        "example.com",
+        "bitcoin.example.com",
+        "a" * 63,
+        "bitcoin_node_1",
+    ])
+    def test_valid_host(self, host):
+        assert VALIDATOR.is_valid_host(host)
     
-    def test_invalid_hosts(self):
-        validator = ConfigValidator()
-        
-        # Invalid inputs
-        assert not validator.is_valid_host("")
-        assert not validator.is_valid_host("256.256.256.256")
-        assert not validator.is_valid_host("-invalid")
-        assert not validator.is_valid_host("invalid-")
-        assert not validator.is_valid_host("invalid..com")
+    @pytest.mark.parametrize("host", [
+        "",
+        "256.256.256.256",
+        "-invalid",
+        "invalid-",
+        "invalid..com",
+        "a" * 64,
+        ".".join(["a" * 63] * 4),  # 255 characters
+        "a.-b",
+        "localhost\n",
+        # Near-miss input rejected in a single pass
+        ("a-" * 31 + "a.") * 3 + "-",
+    ])
+    def test_invalid_host(self, host):
+        assert not VALIDATOR.is_valid_host(host)
     
-    def test_valid_ports(self):
-        validator = ConfigValidator()
-        
-        # Valid ports
-        assert validator.is_valid_port(8332)
-        assert validator.is_valid_port("8332")
-        assert validator.is_valid_port(1)
-        assert validator.is_valid_port(65535)
-        assert validator.is_valid_port("18332")
+    @pytest.mark.parametrize("port", [8332, "8332", 1, 65535, "18332"])
+    def test_valid_port(self, port):
+        assert VALIDATOR.is_valid_port(port)
     
-    def test_invalid_ports(self):
-        validator = ConfigValidator()
-        
-        # Invalid ports
-        assert not validator.is_valid_port(0)
-        assert not validator.is_valid_port(-1)
-        assert not validator.is_valid_port(65536)
-        assert not validator.is_valid_port("invalid")
-        assert not validator.is_valid_port("")
-        assert not validator.is_valid_port(None)
+    @pytest.mark.parametrize("port", [0, -1, 65536, "invalid", "", None])
+    def test_invalid_port(self, port):
+        assert not VALIDATOR.is_valid_port(port)
     
-    def test_valid_timeouts(self):
-        validator = ConfigValidator()
-        
-        # Valid timeouts
-        assert validator.is_valid_timeout(30)
-        assert validator.is_valid_timeout("30")
-        assert validator.is_valid_timeout(1)
-        assert validator.is_valid_timeout(300)
+    @pytest.mark.parametrize("timeout", [30, "30", 1, 300])
+    def test_valid_timeout(self, timeout):
+        assert VALIDATOR.is_valid_timeout(timeout)
     
-    def test_invalid_timeouts(self):
-        validator = ConfigValidator()
-        
-        # Invalid timeouts
-        assert not validator.is_valid_timeout(0)
-        assert not validator.is_valid_timeout(-1)
-        assert not validator.is_valid_timeout(301)
-        assert not validator.is_valid_timeout("invalid")
-        assert not validator.is_valid_timeout(None)
+    @pytest.mark.parametrize("timeout", [0, -1, 301, "invalid", None])
+    def test_invalid_timeout(self, timeout):
+        assert not VALIDATOR.is_valid_timeout(timeout)
+
+
+class TestInputValidator:
+    """Test user input validators"""
+    
+    def test_block_hash_and_txid(self):
+        genesis = "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f"
+        
+        for check in (InputValidator.is_valid_block_hash, InputValidator.is_valid_transaction_id):
+            assert check(genesis)
+            assert check(genesis.upper())
+            
+            assert not check(genesis[:-1])
+            assert not check(genesis + "0")
+            assert not check("g" + genesis[1:])
+            assert not check("00 " + genesis[3:])
+            assert not check(None)
+            assert not check(int(genesis, 16))
+    
+    def test_bitcoin_addresses(self):
+        validator = InputValidator()
+        
+        assert validator.is_valid_bitcoin_address("1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2")
+        assert validator.is_valid_bitcoin_address("3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy")
+        assert validator.is_valid_bitcoin_address("bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq")
+        assert validator.is_valid_bitcoin_address("tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx")
+        
+        assert not validator.is_valid_bitcoin_address("")
+        assert not validator.is_valid_bitcoin_address("1BvBMSEYst0etqTFn5Au4m4GFg7xJaNVN2")
+        assert not validator.is_valid_bitcoin_address("bc1QAR0SRRR7XFKVY5L643LYDNW9RE59GTZZWF5MDQ")
+        assert not validator.is_valid_bitcoin_address("2N3oefVeg6stiTb5Kh3ozCSkaqmx91FDbsm")
+        assert not validator.is_valid_bitcoin_address(None)
+    
+    def test_validate_json_rpc_params(self):
+        params = ["hash123", 1, 1.5, True, None, ["a"], {"k": "v"}]
+        assert InputValidator.validate_json_rpc_params(params) == params
+        
+        with pytest.raises(ValueError, match="Invalid characters"):
+            InputValidator.validate_json_rpc_params(["invalid;chars"])
+        
+        with pytest.raises(ValueError, match="Invalid characters"):
+            InputValidator.validate_json_rpc_params(["hash123\n"])
+        
+        with pytest.raises(ValueError, match="Unsupported parameter type"):
+            InputValidator.validate_json_rpc_params([object()])
+    
+    def test_validate_block_hash_cache(self):
+        genesis = "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f"
+        validate_block_hash.cache_clear()
+        
+        assert validate_block_hash(genesis) == genesis
+        assert validate_block_hash(genesis) == genesis
+        assert validate_block_hash.cache_info().hits == 1
+        
+        # Failures are raised every time and never cached
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid block hash"):
+                validate_block_hash("invalid_hash")
+        assert validate_block_hash.cache_info().currsize == 1
+        
+        # Unhashable values are rejected rather than tripping the cache
+        with pytest.raises(ValueError, match="Invalid block hash"):
+            validate_block_hash([genesis])
 
 
 class TestConfig:
     """Test configuration loading and validation"""
     
-    def create_temp_config(self, content):
-        """Helper to create temporary config file"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env')
-        temp_file.write(content)
-        temp_file.close()
-        return temp_file.name
+    @pytest.fixture
+    def env_file(self, tmp_path):
+        """Factory writing .env content to a per-test temporary file"""
+        def write(content):
+            path = tmp_path / '.env'
+            path.write_text(content)
+            return str(path)
+        
+        return write
     
-    def test_default_config(self):
+    @pytest.fixture
+    def base_env(self, monkeypatch):
+        """Set the RPC credentials every Config needs; returns monkeypatch for extra settings"""
+        monkeypatch.setenv('BITCOIN_RPC_USER', 'testuser')
+        monkeypatch.setenv('BITCOIN_RPC_PASSWORD', 'testpass')
+        return monkeypatch
+    
+    def test_default_config(self, base_env):
         """Test default configuration values"""
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass'
-        }):
-            config = Config('nonexistent.env')
-            
-            assert config.host == '127.0.0.1'
-            assert config.port == 8332
-            assert config.user == 'testuser'
-            assert config.password == 'testpass'
-            assert config.timeout == 30
-            assert config.network == 'mainnet'
-            assert config.use_ssl == False
-            assert config.ssl_verify == True
-            assert config.log_level == 'INFO'
+        config = Config('nonexistent.env')
+        
+        assert config.host == '127.0.0.1'
+        assert config.port == 8332
+        assert config.user == 'testuser'
+        assert config.password == 'testpass'
+        assert config.timeout == 30
+        assert config.network == 'mainnet'
+        assert config.use_ssl == False
+        assert config.ssl_verify == True
+        assert config.log_level == 'INFO'
     
-    def test_env_file_loading(self):
+    def test_env_file_loading(self, env_file):
         """Test loading configuration from .env file"""
         config_content = """
 # Test configuration
@@ -125,22 +182,19 @@ BITCOIN_RPC_USE_SSL=true
 LOG_LEVEL=DEBUG
 """
         
-        config_file = self.create_temp_config(config_content)
+        config_file = env_file(config_content)
         
-        try:
-            config = Config(config_file)
-            
-            assert config.host == '192.168.1.100'
-            assert config.port == 18332
-            assert config.user == 'testuser'
-            assert config.password == 'testpass'
-            assert config.network == 'testnet'
-            assert config.use_ssl == True
-            assert config.log_level == 'DEBUG'
-        finally:
-            os.unlink(config_file)
+        config = Config(config_file)
+        
+        assert config.host == '192.168.1.100'
+        assert config.port == 18332
+        assert config.user == 'testuser'
+        assert config.password == 'testpass'
+        assert config.network == 'testnet'
+        assert config.use_ssl == True
+        assert config.log_level == 'DEBUG'
     
-    def test_environment_variable_override(self):
+    def test_environment_variable_override(self, env_file):
         """Test environment variables override .env file"""
         config_content = """
 BITCOIN_RPC_HOST=192.168.1.100
@@ -149,54 +203,49 @@ BITCOIN_RPC_USER=fileuser
 BITCOIN_RPC_PASSWORD=filepass
 """
         
-        config_file = self.create_temp_config(config_content)
+        config_file = env_file(config_content)
         
-        try:
-            with patch.dict(os.environ, {
-                'BITCOIN_RPC_HOST': '10.0.0.1',
-                'BITCOIN_RPC_USER': 'envuser',
-                'BITCOIN_RPC_PASSWORD': 'envpass'
-            }):
-                config = Config(config_file)
-                
-                # Environment variables should override file values
-                assert config.host == '10.0.0.1'
-                assert config.user == 'envuser'
-                assert config.password == 'envpass'
-                
-                # File values should be used when no env var exists
-                assert config.port == 18332
-        finally:
-            os.unlink(config_file)
+        with patch.dict(os.environ, {
+            'BITCOIN_RPC_HOST': '10.0.0.1',
+            'BITCOIN_RPC_USER': 'envuser',
+            'BITCOIN_RPC_PASSWORD': 'envpass'
+        }):
+            config = Config(config_file)
+            
+            # Environment variables should override file values
+            assert config.host == '10.0.0.1'
+            assert config.user == 'envuser'
+            assert config.password == 'envpass'
+            
+            # File values should be used when no env var exists
+            assert config.port == 18332
     
-    def test_docker_secrets(self):
+    def test_docker_secrets(self, env_file):
         """Test Docker secrets support"""
-        # Mock Docker secret files
-        with patch('os.path.exists') as mock_exists:
+        # Mock the Docker secrets directory listing and secret files
+        secret_files = [
+            SimpleNamespace(name=name, path=f'/run/secrets/{name}')
+            for name in ('bitcoin_rpc_user', 'bitcoin_rpc_password')
+        ]
+        with patch('config.os.scandir', return_value=iter(secret_files)) as mock_scandir:
             with patch('builtins.open', mock_open(read_data='secret_value')):
-                # Simulate Docker secret files exist
-                mock_exists.side_effect = lambda path: path in [
-                    '/run/secrets/bitcoin_rpc_user',
-                    '/run/secrets/bitcoin_rpc_password'
-                ]
-                
                 config_content = """
 BITCOIN_RPC_HOST=127.0.0.1
 BITCOIN_RPC_PORT=8332
 """
                 
-                config_file = self.create_temp_config(config_content)
+                config_file = env_file(config_content)
                 
-                try:
-                    config = Config(config_file)
-                    
-                    # Should use Docker secrets
-                    assert config.user == 'secret_value'
-                    assert config.password == 'secret_value'
-                finally:
-                    os.unlink(config_file)
+                config = Config(config_file)
+                
+                # Should use Docker secrets
+                assert config.user == 'secret_value'
+                assert config.password == 'secret_value'
+                
+                # Both secrets come from a single directory listing
+                mock_scandir.assert_called_once_with('/run/secrets')
     
-    def test_quoted_values(self):
+    def test_quoted_values(self, env_file):
         """Test handling of quoted values in .env file"""
         config_content = '''
 BITCOIN_RPC_USER="quoted_user"
@@ -204,18 +253,99 @@ BITCOIN_RPC_PASSWORD='single_quoted_pass'
 BITCOIN_RPC_HOST=unquoted_host
 '''
         
-        config_file = self.create_temp_config(config_content)
+        config_file = env_file(config_content)
+        
+        config = Config(config_file)
         
-        try:
+        assert config.user == 'quoted_user'
+        assert config.password == 'single_quoted_pass'
+        assert config.host == 'unquoted_host'
+    
+    def test_env_line_parsing(self, env_file):
+        """Test spacing around '=', unbalanced quotes and malformed lines"""
+        config_content = """
+BITCOIN_RPC_USER = "spaced_user"
+BITCOIN_RPC_PASSWORD=testpass
+LOG_FILE="unbalanced
+not a setting
+=missing_key
+"""
+        
+        config_file = env_file(config_content)
+        
+        config = Config(config_file)
+        
+        assert config.user == 'spaced_user'
+        assert config._load_env_file() == {
+            'BITCOIN_RPC_USER': 'spaced_user',
+            'BITCOIN_RPC_PASSWORD': 'testpass',
+            'LOG_FILE': '"unbalanced'
+        }
+    
+    def test_large_env_file_mapped(self, env_file):
+        """Test large .env files parse the same through the memory-mapped path"""
+        lines = """
+BITCOIN_RPC_USER = "spaced_user"
+BITCOIN_RPC_PASSWORD='testpass'
+LOG_FILE=wrapper.log
+not a setting
+"""
+        padding = "# padding\n" * (ENV_MMAP_MIN_SIZE // 10)
+        config_file = env_file(padding + lines)
+        
+        config = Config(config_file)
+        
+        with patch.object(config.logger, 'warning') as mock_warning:
+            assert config._load_env_file() == {
+                'BITCOIN_RPC_USER': 'spaced_user',
+                'BITCOIN_RPC_PASSWORD': 'testpass',
+                'LOG_FILE': 'wrapper.log'
+            }
+        
+        line_num = padding.count("\n") + 5
+        mock_warning.assert_called_once_with(f"Invalid line {line_num} in {config_file}: not a setting")
+    
+    def test_get_config_cached_until_file_changes(self, env_file):
+        """Test get_config reuses the loaded Config until the file is modified"""
+        config_file = env_file("BITCOIN_RPC_USER=first\nBITCOIN_RPC_PASSWORD=testpass\n")
+        
+        config = get_config(config_file)
+        assert get_config(config_file) is config
+        
+        with open(config_file, 'w') as f:
+            f.write("BITCOIN_RPC_USER=second\nBITCOIN_RPC_PASSWORD=testpass\n")
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = get_config(config_file)
+        assert reloaded is not config
+        assert reloaded.user == 'second'
+        
+        # Environment overrides are part of the cache key
+        with patch.dict(os.environ, {'BITCOIN_RPC_HOST': '10.0.0.1'}):
+            overridden = get_config(config_file)
+            assert overridden is not reloaded
+            assert overridden.host == '10.0.0.1'
+        assert get_config(config_file).host == '127.0.0.1'
+    
+    def test_env_file_read_once(self, env_file):
+        """Test the .env file is parsed once even when secrets fall back to it"""
+        config_content = """
+BITCOIN_RPC_USER=testuser
+BITCOIN_RPC_PASSWORD=testpass
+"""
+        
+        config_file = env_file(config_content)
+        
+        with patch.object(Config, '_load_env_file', autospec=True,
+                          side_effect=Config._load_env_file) as mock_load:
             config = Config(config_file)
-            
-            assert config.user == 'quoted_user'
-            assert config.password == 'single_quoted_pass'
-            assert config.host == 'unquoted_host'
-        finally:
-            os.unlink(config_file)
+        
+        assert config.user == 'testuser'
+        assert config.password == 'testpass'
+        assert mock_load.call_count == 1
     
-    def test_comments_and_empty_lines(self):
+    def test_comments_and_empty_lines(self, env_file):
         """Test handling of comments and empty lines"""
         config_content = """
 # This is a comment
@@ -228,116 +358,81 @@ BITCOIN_RPC_USER=testuser
 BITCOIN_RPC_PASSWORD=testpass
 """
         
-        config_file = self.create_temp_config(config_content)
+        config_file = env_file(config_content)
         
-        try:
-            config = Config(config_file)
-            
-            assert config.host == '127.0.0.1'
-            assert config.port == 8332
-            assert config.user == 'testuser'
-            assert config.password == 'testpass'
-        finally:
-            os.unlink(config_file)
+        config = Config(config_file)
+        
+        assert config.host == '127.0.0.1'
+        assert config.port == 8332
+        assert config.user == 'testuser'
+        assert config.password == 'testpass'
     
-    def test_validation_errors(self):
+    def test_validation_errors(self, monkeypatch):
         """Test configuration validation errors"""
         # Test missing credentials
         with pytest.raises(ValueError, match="Required configuration BITCOIN_RPC_USER not found"):
             Config('nonexistent.env')
         
+        monkeypatch.setenv('BITCOIN_RPC_USER', 'testuser')
+        monkeypatch.setenv('BITCOIN_RPC_PASSWORD', 'testpass')
+        
         # Test invalid port
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass',
-            'BITCOIN_RPC_PORT': '99999'
-        }):
+        with monkeypatch.context() as m:
+            m.setenv('BITCOIN_RPC_PORT', '99999')
             with pytest.raises(ValueError, match="Invalid port"):
                 Config('nonexistent.env')
         
         # Test invalid network
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass',
-            'BITCOIN_NETWORK': 'invalid'
-        }):
-            with pytest.raises(ValueError, match="Invalid network"):
-                Config('nonexistent.env')
+        monkeypatch.setenv('BITCOIN_NETWORK', 'invalid')
+        with pytest.raises(ValueError, match="Invalid network"):
+            Config('nonexistent.env')
     
-    def test_rpc_url_generation(self):
+    def test_rpc_url_generation(self, base_env):
         """Test RPC URL generation"""
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass',
-            'BITCOIN_RPC_HOST': 'bitcoin.example.com',
-            'BITCOIN_RPC_PORT': '8332',
-            'BITCOIN_RPC_USE_SSL': 'false'
-        }):
-            config = Config('nonexistent.env')
-            assert config.rpc_url == 'http://bitcoin.example.com:8332'
+        base_env.setenv('BITCOIN_RPC_HOST', 'bitcoin.example.com')
+        base_env.setenv('BITCOIN_RPC_PORT', '8332')
         
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass',
-            'BITCOIN_RPC_HOST': 'bitcoin.example.com',
-            'BITCOIN_RPC_PORT': '8332',
-            'BITCOIN_RPC_USE_SSL': 'true'
-        }):
-            config = Config('nonexistent.env')
-            assert config.rpc_url == 'https://bitcoin.example.com:8332'
+        base_env.setenv('BITCOIN_RPC_USE_SSL', 'false')
+        config = Config('nonexistent.env')
+        assert config.rpc_url == 'http://bitcoin.example.com:8332'
+        
+        base_env.setenv('BITCOIN_RPC_USE_SSL', 'true')
+        config = Config('nonexistent.env')
+        assert config.rpc_url == 'https://bitcoin.example.com:8332'
     
-    def test_auth_tuple(self):
+    def test_auth_tuple(self, base_env):
         """Test authentication tuple generation"""
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass'
-        }):
-            config = Config('nonexistent.env')
-            assert config.auth == ('testuser', 'testpass')
+        config = Config('nonexistent.env')
+        assert config.auth == ('testuser', 'testpass')
     
-    def test_to_dict(self):
+    def test_to_dict(self, base_env):
         """Test configuration dictionary representation"""
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass'
-        }):
-            config = Config('nonexistent.env')
-            config_dict = config.to_dict()
-            
-            # Should not include sensitive data
-            assert 'user' not in config_dict
-            assert 'password' not in config_dict
-            
-            # Should include non-sensitive data
-            assert config_dict['host'] == '127.0.0.1'
-            assert config_dict['port'] == 8332
-            assert config_dict['network'] == 'mainnet'
+        config = Config('nonexistent.env')
+        config_dict = config.to_dict()
+        
+        # Should not include sensitive data
+        assert 'user' not in config_dict
+        assert 'password' not in config_dict
+        
+        # Should include non-sensitive data
+        assert config_dict['host'] == '127.0.0.1'
+        assert config_dict['port'] == 8332
+        assert config_dict['network'] == 'mainnet'
     
-    def test_ssl_certificate_validation(self):
+    def test_ssl_certificate_validation(self, base_env, tmp_path):
         """Test SSL certificate path validation"""
         # Create a temporary certificate file
-        temp_cert = tempfile.NamedTemporaryFile(suffix='.pem', delete=False)
-        temp_cert.close()
+        temp_cert = tmp_path / 'cert.pem'
+        temp_cert.touch()
         
-        try:
-            with patch.dict(os.environ, {
-                'BITCOIN_RPC_USER': 'testuser',
-                'BITCOIN_RPC_PASSWORD': 'testpass',
-                'BITCOIN_RPC_SSL_CERT_PATH': temp_cert.name
-            }):
-                config = Config('nonexistent.env')
-                assert config.ssl_cert_path == temp_cert.name
-        finally:
-            os.unlink(temp_cert.name)
+        base_env.setenv('BITCOIN_RPC_SSL_CERT_PATH', str(temp_cert))
+        config = Config('nonexistent.env')
+        assert config.ssl_cert_path == str(temp_cert)
         
         # Test invalid certificate path
-        with patch.dict(os.environ, {
-            'BITCOIN_RPC_USER': 'testuser',
-            'BITCOIN_RPC_PASSWORD': 'testpass',
-            'BITCOIN_RPC_SSL_CERT_PATH': '/nonexistent/cert.pem'
-        }):
-            with pytest.raises(ValueError, match="SSL certificate file not found"):
-                Config('nonexistent.env')
+        base_env.setenv('BITCOIN_RPC_SSL_CERT_PATH', '/nonexistent/cert.pem')
+        with pytest.raises(ValueError, match="SSL certificate file not found"):
+            Config('nonexistent.env')
 
 
 if __name__ == '__main__':
@@ -6,18 +6,43 @@ Tests against a real Bitcoin node (regtest mode recommended)
 import pytest
 import os
 import sys
-import json
+import shutil
 import subprocess
 import time
 from pathlib import Path
+from unittest.mock import patch
+
+# orjson parses the CLI's bytes output directly when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Add lib directory to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from config import Config
 from rpc_client import BitcoinRPCClient
-from commands.blockchain import BlockchainCommands
-from commands.network import NetworkCommands
+
+# Docker repository names must be lowercase
+DOCKER_TEST_IMAGE = 'bitcoin-cli-rpc-weapper:test'
+
+# Looked up once so Docker-less runs skip without spawning a process
+DOCKER_AVAILABLE = shutil.which('docker') is not None
+DOCKER_COMPOSE_AVAILABLE = shutil.which('docker-compose') is not None
+
+
+@pytest.fixture(scope="session")
+def integration_rpc_client():
+    """
+    RPC client shared by all node integration tests in the session
+    
+    Under pytest-xdist (``pytest -n auto``) each worker is its own session,
+    so every worker gets one client and its connection pool.
+    """
+    client = BitcoinRPCClient(TestIntegration._create_test_config())
+    yield client
+    client.close()
 
 
 class TestIntegration:
@@ -34,7 +59,11 @@ class TestIntegration:
         
         # Create test configuration
         cls.config = cls._create_test_config()
-        cls.rpc_client = BitcoinRPCClient(cls.config)
+    
+    @pytest.fixture(autouse=True)
+    def _bind_rpc_client(self, integration_rpc_client):
+        """Expose the shared RPC client to each test"""
+        self.rpc_client = integration_rpc_client
     
     @classmethod
     def _check_bitcoin_node(cls):
@@ -42,9 +71,9 @@ class TestIntegration:
         try:
             # Try to connect using environment variables or defaults
             test_config = Config('.env.test')
-            test_client = BitcoinRPCClient(test_config)
-            test_client.test_connection()
-            test_client.close()
+            with BitcoinRPCClient(test_config) as test_client:
+                # Kept for test_connection rather than probing the node twice
+                cls.connection_result = test_client.test_connection()
             return True
         except Exception as e:
             print(f"Bitcoin node not available: {e}")
@@ -85,19 +114,14 @@ class TestIntegration:
         
         return TestConfig(**config_overrides)
     
-    @classmethod
-    def teardown_class(cls):
-        """Cleanup after integration tests"""
-        if hasattr(cls, 'rpc_client'):
-            cls.rpc_client.close()
-    
     def test_connection(self):
         """Test basic connection to Bitcoin node"""
-        result = self.rpc_client.test_connection()
-        assert result == True
+        assert self.connection_result == True
     
     def test_blockchain_info(self):
         """Test getting blockchain information"""
+        from commands.blockchain import BlockchainCommands
+        
         blockchain_commands = BlockchainCommands(self.rpc_client)
         
         info = blockchain_commands.get_blockchain_info()
@@ -113,6 +137,8 @@ class TestIntegration:
     
     def test_network_info(self):
         """Test getting network information"""
+        from commands.network import NetworkCommands
+        
         network_commands = NetworkCommands(self.rpc_client)
         
         info = network_commands.get_network_info()
@@ -125,6 +151,8 @@ class TestIntegration:
     
     def test_block_operations(self):
         """Test block-related operations"""
+        from commands.blockchain import BlockchainCommands
+        
         blockchain_commands = BlockchainCommands(self.rpc_client)
         
         # Get current block count
@@ -147,6 +175,8 @@ class TestIntegration:
     
     def test_peer_info(self):
         """Test peer information"""
+        from commands.network import NetworkCommands
+        
         network_commands = NetworkCommands(self.rpc_client)
         
         # Get connection count
@@ -161,6 +191,8 @@ class TestIntegration:
     
     def test_mempool_info(self):
         """Test mempool information"""
+        from commands.blockchain import BlockchainCommands
+        
         blockchain_commands = BlockchainCommands(self.rpc_client)
         
         mempool_info = blockchain_commands.get_mempool_info()
@@ -173,6 +205,8 @@ class TestIntegration:
     
     def test_error_handling(self):
         """Test error handling with invalid requests"""
+        from commands.blockchain import BlockchainCommands
+        
         blockchain_commands = BlockchainCommands(self.rpc_client)
         
         # Test with invalid block hash
@@ -208,165 +242,156 @@ class TestCLIIntegration:
         if not cls.bitcoin_available:
             pytest.skip("Bitcoin node not available for CLI integration tests")
     
+    @classmethod
+    def _run_cli(cls, *args):
+        """
+        Run the CLI script in a fresh interpreter
+        
+        -I skips user site-packages and PYTHON* environment handling and -B
+        skips writing bytecode. -S is not used: the CLI needs site-packages
+        for its dependencies. Output is kept as bytes for json_loads.
+        """
+        return subprocess.run(
+            [sys.executable, '-I', '-B', str(cls.cli_script), *args],
+            capture_output=True, timeout=30
+        )
+    
     @classmethod
     def _check_bitcoin_node(cls):
         """Check if Bitcoin node is available for CLI tests"""
         try:
-            result = subprocess.run([
-                'python3', str(cls.cli_script), 
-                '--config', '.env.test',
-                'getblockchaininfo'
-            ], capture_output=True, text=True, timeout=30)
+            result = cls._run_cli('--config', '.env.test', 'getblockchaininfo')
             
             if result.returncode == 0:
-                response = json.loads(result.stdout)
+                response = json_loads(result.stdout)
                 return response.get('success', False)
             return False
         except Exception:
             return False
     
-    def test_cli_help(self):
-        """Test CLI help output"""
-        result = subprocess.run([
-            'python3', str(self.cli_script), '--help'
-        ], capture_output=True, text=True)
+    def run_main(self, capsys, *args):
+        """Run the CLI entry point in-process and return (exit code, parsed JSON output)"""
+        from main_wrapper import main
         
-        assert result.returncode == 0
-        assert 'Bitcoin CLI Wrapper' in result.stdout
-        assert 'getblockchaininfo' in result.stdout
+        with patch.object(sys, 'argv', ['bitcoin_cli_wrapper.py', '--config', '.env.test', *args]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        
+        return exc_info.value.code, json_loads(capsys.readouterr().out)
     
-    def test_cli_blockchain_info(self):
-        """Test CLI blockchain info command"""
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            'getblockchaininfo'
-        ], capture_output=True, text=True, timeout=30)
+    def test_cli_smoke(self):
+        """Test the CLI script end to end in a fresh interpreter"""
+        result = self._run_cli('--config', '.env.test', 'getblockchaininfo')
         
         assert result.returncode == 0
         
-        response = json.loads(result.stdout)
+        response = json_loads(result.stdout)
         assert response['success'] == True
-        assert 'data' in response
         assert 'chain' in response['data']
     
-    def test_cli_network_info(self):
-        """Test CLI network info command"""
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            'getnetworkinfo'
-        ], capture_output=True, text=True, timeout=30)
+    def test_cli_help(self, capsys):
+        """Test CLI help output"""
+        from main_wrapper import main
         
-        assert result.returncode == 0
+        with patch.object(sys, 'argv', ['bitcoin_cli_wrapper.py', '--help']):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
         
-        response = json.loads(result.stdout)
+        output = capsys.readouterr().out
+        assert exc_info.value.code == 0
+        assert 'Bitcoin CLI Wrapper' in output
+        assert 'getblockchaininfo' in output
+    
+    @pytest.mark.parametrize("command, field", [
+        ("getblockchaininfo", "chain"),
+        ("getnetworkinfo", "version"),
+    ])
+    def test_cli_info_commands(self, capsys, command, field):
+        """Test CLI info commands return their node data"""
+        exit_code, response = self.run_main(capsys, command)
+        
+        assert exit_code == 0
         assert response['success'] == True
-        assert 'data' in response
-        assert 'version' in response['data']
+        assert field in response['data']
     
-    def test_cli_block_count(self):
+    def test_cli_block_count(self, capsys):
         """Test CLI block count command"""
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            'getblockcount'
-        ], capture_output=True, text=True, timeout=30)
+        exit_code, response = self.run_main(capsys, 'getblockcount')
         
-        assert result.returncode == 0
-        
-        response = json.loads(result.stdout)
+        assert exit_code == 0
         assert response['success'] == True
-        assert 'data' in response
         assert isinstance(response['data'], int)
     
-    def test_cli_invalid_command(self):
+    def test_cli_invalid_command(self, capsys):
         """Test CLI with invalid command"""
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            'invalidcommand'
-        ], capture_output=True, text=True, timeout=30)
+        exit_code, response = self.run_main(capsys, 'invalidcommand')
         
-        assert result.returncode == 1
-        
-        response = json.loads(result.stdout)
+        assert exit_code == 1
         assert response['success'] == False
         assert 'Unknown command' in response['error']
     
-    def test_cli_verbose_mode(self):
+    def test_cli_verbose_mode(self, capsys):
         """Test CLI verbose mode"""
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            '--verbose',
-            'getblockchaininfo'
-        ], capture_output=True, text=True, timeout=30)
-        
-        assert result.returncode == 0
+        exit_code, response = self.run_main(capsys, '--verbose', 'getblockchaininfo')
         
-        response = json.loads(result.stdout)
+        assert exit_code == 0
         assert response['success'] == True
     
-    def test_cli_with_parameters(self):
+    def test_cli_with_parameters(self, capsys):
         """Test CLI with command parameters"""
         # First get a block hash
-        result = subprocess.run([
-            'python3', str(self.cli_script),
-            '--config', '.env.test',
-            'getbestblockhash'
-        ], capture_output=True, text=True, timeout=30)
+        exit_code, response = self.run_main(capsys, 'getbestblockhash')
         
-        if result.returncode == 0:
-            response = json.loads(result.stdout)
-            if response['success']:
-                block_hash = response['data']
-                
-                # Now get the block
-                result = subprocess.run([
-                    'python3', str(self.cli_script),
-                    '--config', '.env.test',
-                    'getblock', block_hash
-                ], capture_output=True, text=True, timeout=30)
-                
-                assert result.returncode == 0
-                
-                response = json.loads(result.stdout)
-                assert response['success'] == True
-                assert response['data']['hash'] == block_hash
+        if exit_code == 0 and response['success']:
+            block_hash = response['data']
+            
+            # Now get the block
+            exit_code, response = self.run_main(capsys, 'getblock', block_hash)
+            
+            assert exit_code == 0
+            assert response['success'] == True
+            assert response['data']['hash'] == block_hash
 
 
 class TestDockerIntegration:
     """Integration tests for Docker setup"""
     
+    @pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker not available")
     def test_docker_build(self):
         """Test Docker image build"""
-        try:
-            result = subprocess.run([
-                'docker', 'build', '-t', 'bitcoin-CLI-RPC-weapper:test', '.'
-            ], capture_output=True, text=True, timeout=300)
-            
-            # If Docker is available, build should succeed
-            if result.returncode == 0:
-                assert 'Successfully tagged bitcoin-CLI-RPC-weapper:test' in result.stdout
-            else:
-                pytest.skip("Docker not available or build failed")
-        except FileNotFoundError:
-            pytest.skip("Docker not available")
+        # An image already built for this checkout is reused as is
+        inspect = subprocess.run([
+            'docker', 'image', 'inspect', DOCKER_TEST_IMAGE
+        ], capture_output=True, text=True, timeout=30)
+        if inspect.returncode == 0:
+            return
+        
+        # BuildKit reuses cached layers between runs
+        result = subprocess.run([
+            'docker', 'build', '-t', DOCKER_TEST_IMAGE, '.'
+        ], capture_output=True, text=True, timeout=300,
+            env={**os.environ, 'DOCKER_BUILDKIT': '1'})
+        
+        # If the Docker daemon is reachable, build should succeed
+        if result.returncode == 0:
+            inspect = subprocess.run([
+                'docker', 'image', 'inspect', DOCKER_TEST_IMAGE
+            ], capture_output=True, text=True, timeout=30)
+            assert inspect.returncode == 0
+        else:
+            pytest.skip("Docker daemon not available or build failed")
     
+    @pytest.mark.skipif(not DOCKER_COMPOSE_AVAILABLE, reason="Docker Compose not available")
     def test_docker_compose_validation(self):
         """Test Docker Compose file validation"""
-        try:
-            result = subprocess.run([
-                'docker-compose', 'config'
-            ], capture_output=True, text=True, timeout=30)
-            
-            # Should exit successfully if docker-compose.yml is valid
-            if result.returncode == 0:
-                assert len(result.stdout) > 0  # Should output composed configuration
-            else:
-                pytest.skip("Docker Compose not available")
-        except FileNotFoundError:
+        result = subprocess.run([
+            'docker-compose', 'config'
+        ], capture_output=True, text=True, timeout=30)
+        
+        # Should exit successfully if docker-compose.yml is valid
+        if result.returncode == 0:
+            assert len(result.stdout) > 0  # Should output composed configuration
+        else:
             pytest.skip("Docker Compose not available")
 
 
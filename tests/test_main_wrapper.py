@@ -0,0 +1,226 @@
+"""
+Test suite for the CLI entry point
+"""
+
+import pytest
+import sys
+import os
+import io
+import json
+import importlib
+import logging
+from types import SimpleNamespace
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+import main_wrapper
+from main_wrapper import (
+    COMMAND_MAP, bind_commands, create_parser, execute_command, parse_args, setup_logging, write_json
+)
+
+
+class TestParseArgs:
+    """Test the fast command line parser agrees with argparse"""
+    
+    def assert_matches_argparse(self, argv):
+        expected = vars(create_parser().parse_args(argv))
+        assert vars(parse_args(argv)) == expected
+    
+    def test_command_only(self):
+        self.assert_matches_argparse(['getblockcount'])
+    
+    def test_command_with_params(self):
+        self.assert_matches_argparse(['getblock', 'abc123', '2'])
+    
+    def test_options_anywhere(self):
+        self.assert_matches_argparse(['--config', 'node.env', 'getblockhash', '100', '-v'])
+        self.assert_matches_argparse(['-v', 'getblockhash', '100', '--check-connection'])
+    
+    def test_unusual_forms_fall_back_to_argparse(self):
+        self.assert_matches_argparse(['--config=node.env', 'getblockcount'])
+        self.assert_matches_argparse(['getblockhash', '--', '100'])
+    
+    def test_errors_reported_by_argparse(self):
+        for argv in ([], ['--config'], ['--unknown', 'getblockcount']):
+            with pytest.raises(SystemExit):
+                parse_args(argv)
+    
+    def test_option_between_params_rejected(self):
+        for argv in (['getblock', '-v', 'abc123'],
+                     ['getblock', 'abc123', '--check-connection', '2'],
+                     ['getblock', '--config', 'node.env', 'abc123']):
+            with pytest.raises(SystemExit):
+                create_parser().parse_args(argv)
+            with pytest.raises(SystemExit):
+                parse_args(argv)
+    
+    def test_config_value_looking_like_option(self):
+        for argv in (['--config', '-v', 'getblockcount'],
+                     ['--config', '--check-connection', 'getblockcount']):
+            with pytest.raises(SystemExit):
+                create_parser().parse_args(argv)
+            with pytest.raises(SystemExit):
+                parse_args(argv)
+    
+    def test_options_around_params(self):
+        self.assert_matches_argparse(['-v', 'getblock', 'abc123', '2', '-v'])
+        self.assert_matches_argparse(['getblock', 'abc123', '-v', '--config', 'node.env'])
+
+
+class TestSetupLogging:
+    """Test logging setup from configuration"""
+    
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        root = logging.getLogger()
+        level, handlers = root.level, root.handlers[:]
+        yield
+        root.setLevel(level)
+        root.handlers[:] = handlers
+    
+    def test_configured_level(self):
+        config = SimpleNamespace(log_level='warning', log_file=None)
+        setup_logging(config)
+        assert logging.getLogger().level == logging.WARNING
+    
+    def test_verbose_does_not_modify_config(self):
+        config = SimpleNamespace(log_level='WARNING', log_file=None)
+        setup_logging(config, verbose=True)
+        assert logging.getLogger().level == logging.DEBUG
+        assert config.log_level == 'WARNING'
+
+
+class TestWriteJson:
+    """Test JSON output to stdout"""
+    
+    def test_stream_without_buffer(self, monkeypatch):
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, 'stdout', stream)
+        write_json({"b": 1, "a": [1, 2]})
+        assert stream.getvalue().endswith('\n')
+        assert json.loads(stream.getvalue()) == {"a": [1, 2], "b": 1}
+        assert stream.getvalue().index('"a"') < stream.getvalue().index('"b"')
+
+
+class RecordingRPCClient:
+    """Fake RPC client recording each call with its keyword arguments"""
+    
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = []
+    
+    def call(self, method, params=None, **kwargs):
+        self.calls.append((method, params, kwargs))
+        return self.result
+
+
+class TestExecuteCommand:
+    """Test commands are validated once and run through prevalidated handlers"""
+    
+    def test_invalid_param_never_reaches_client(self):
+        client = RecordingRPCClient()
+        result = execute_command(client, 'getblockhash', ['100;rm -rf'])
+        
+        assert result["success"] is False
+        assert result["error_code"] == "RPC_ERROR"
+        assert "Invalid parameters" in result["error"]
+        assert client.calls == []
+    
+    def test_valid_call_skips_revalidation(self):
+        client = RecordingRPCClient(8)
+        result = execute_command(client, 'getconnectioncount', [])
+        
+        assert result == {"success": True, "data": 8, "command": 'getconnectioncount', "params": []}
+        assert client.calls == [("getconnectioncount", None, {"skip_validation": True})]
+    
+    def test_missing_method(self, monkeypatch):
+        monkeypatch.setitem(COMMAND_MAP, 'nosuchmethod', ('blockchain', 'no_such_method'))
+        client = RecordingRPCClient()
+        result = execute_command(client, 'nosuchmethod', [])
+        
+        assert result["error_code"] == "IMPLEMENTATION_ERROR"
+        assert client.calls == []
+    
+    def test_unregistered_module(self, monkeypatch):
+        monkeypatch.setitem(COMMAND_MAP, 'getmininginfo', ('mining', 'get_mining_info'))
+        client = RecordingRPCClient()
+        result = execute_command(client, 'getmininginfo', [])
+        
+        assert result["error_code"] == "IMPLEMENTATION_ERROR"
+        assert client.calls == []
+    
+    @pytest.fixture
+    def handler(self):
+        calls = []
+        return calls, {'getblockhash': lambda *params: calls.append(params) or "hash"}
+    
+    def test_str_subclass_validated_up_front(self, handler):
+        class Param(str):
+            pass
+        
+        calls, commands = handler
+        result = execute_command(RecordingRPCClient(), 'getblockhash', [Param('100;ls')], commands)
+        
+        assert result["success"] is False
+        assert result["error_code"] == "RPC_ERROR"
+        assert "Invalid characters" in result["error"]
+        assert calls == []
+        
+        result = execute_command(RecordingRPCClient(), 'getblockhash', [Param('100')], commands)
+        assert result["success"] is True
+        assert calls == [('100',)]
+    
+    @pytest.mark.parametrize("param", [object(), {1, 2}, b'100'])
+    def test_unsupported_type_validated_up_front(self, handler, param):
+        calls, commands = handler
+        result = execute_command(RecordingRPCClient(), 'getblockhash', [param], commands)
+        
+        assert result == {
+            "success": False,
+            "error": f"Bitcoin RPC Error -32602: Invalid parameters: Unsupported parameter type: {type(param)}",
+            "error_code": "RPC_ERROR",
+            "command": 'getblockhash',
+            "params": [param]
+        }
+        assert calls == []
+    
+    def test_unknown_command(self):
+        result = execute_command(RecordingRPCClient(), 'nosuchcommand', [])
+        assert result["error_code"] == "UNKNOWN_COMMAND"
+
+
+class TestBindCommands:
+    """Test handlers are imported lazily and built once per module"""
+    
+    @pytest.fixture
+    def imported(self, monkeypatch):
+        paths = []
+        
+        def import_module(path):
+            paths.append(path)
+            return importlib.import_module(path)
+        
+        monkeypatch.setattr(main_wrapper, 'importlib', SimpleNamespace(import_module=import_module))
+        return paths
+    
+    def test_only_needed_module_imported(self, imported):
+        result = execute_command(RecordingRPCClient(100), 'getblockcount', [])
+        
+        assert result["success"] is True
+        assert imported == ['src.commands.blockchain']
+    
+    def test_handler_built_once_per_module(self, imported):
+        commands = bind_commands(RecordingRPCClient())
+        
+        count, block_hash = commands['getblockcount'], commands['getblockhash']
+        peers = commands['getpeerinfo']
+        
+        assert count.__self__ is block_hash.__self__
+        assert peers.__self__ is not count.__self__
+        assert commands['getblockcount'] is count
+        assert imported == ['src.commands.blockchain', 'src.commands.network']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,77 @@
+"""
+Test suite for network RPC commands
+"""
+
+import pytest
+import sys
+import os
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from src.commands.network import NetworkCommands, BLOCK_HEADER_BYTES, MAX_BLOCK_BYTES
+
+
+class RecordingRPCClient:
+    """Fake RPC client returning None for every call and recording calls"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def call(self, method, params=None):
+        self.calls.append((method, params))
+
+
+class TestSubmitValidation:
+    """Test hex validation of submitted blocks and headers"""
+    
+    def test_large_block_accepted(self):
+        client = RecordingRPCClient()
+        block = "ab" * (MAX_BLOCK_BYTES - 1000)
+        
+        NetworkCommands(client).submit_block(block)
+        
+        assert client.calls == [("submitblock", [block])]
+    
+    def test_oversize_block_rejected(self):
+        client = RecordingRPCClient()
+        
+        with pytest.raises(ValueError, match="exceeds the maximum size"):
+            NetworkCommands(client).submit_block("00" * (MAX_BLOCK_BYTES + 1))
+        
+        assert client.calls == []
+    
+    @pytest.mark.parametrize("hex_data, message", [
+        ("", "non-empty string"),
+        (None, "non-empty string"),
+        ("abc", "even number of characters"),
+        ("ab cd ", "valid hexadecimal"),
+        ("zz00", "valid hexadecimal"),
+    ])
+    def test_malformed_hex_rejected(self, hex_data, message):
+        client = RecordingRPCClient()
+        
+        with pytest.raises(ValueError, match=message):
+            NetworkCommands(client).submit_block(hex_data)
+        
+        assert client.calls == []
+    
+    def test_header_exact_size(self):
+        client = RecordingRPCClient()
+        header = "00" * BLOCK_HEADER_BYTES
+        
+        NetworkCommands(client).submit_header(header)
+        assert client.calls == [("submitheader", [header])]
+    
+    @pytest.mark.parametrize("size", [1, BLOCK_HEADER_BYTES - 1, BLOCK_HEADER_BYTES + 1])
+    def test_header_wrong_size_rejected(self, size):
+        client = RecordingRPCClient()
+        
+        with pytest.raises(ValueError, match="bytes"):
+            NetworkCommands(client).submit_header("00" * size)
+        
+        assert client.calls == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
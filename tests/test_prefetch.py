@@ -0,0 +1,74 @@
+"""
+Test suite for block prefetching
+"""
+
+import pytest
+import sys
+import os
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from src.commands.prefetch import BlockPrefetcher
+
+
+class FakeBlockchain:
+    """BlockchainCommands stand-in for a chain whose tip is at tip_height"""
+    
+    def __init__(self, tip_height):
+        self.tip_height = tip_height
+        self.batches = []
+        self.direct = []
+    
+    def _check(self, height):
+        if height > self.tip_height:
+            raise ValueError("Block height out of range")
+    
+    def get_block_hashes_batch(self, heights):
+        for height in heights:
+            self._check(height)
+        self.batches.append(list(heights))
+        return [f"hash{height}" for height in heights]
+    
+    def get_blocks_batch(self, block_hashes, verbosity=1):
+        return [{"hash": block_hash} for block_hash in block_hashes]
+    
+    def get_block_hash(self, height):
+        self._check(height)
+        self.direct.append(height)
+        return f"hash{height}"
+    
+    def get_block(self, block_hash, verbosity=1):
+        return {"hash": block_hash}
+
+
+class TestBlockPrefetcher:
+    """Test block prefetching behaviour"""
+    
+    def test_sequential_scan_uses_prefetched_blocks(self):
+        blockchain = FakeBlockchain(tip_height=100)
+        
+        with BlockPrefetcher(blockchain, lookahead=4) as prefetcher:
+            blocks = [prefetcher.get_block_by_height(h) for h in range(9)]
+        
+        assert blocks == [{"hash": f"hash{h}"} for h in range(9)]
+        # Only the first block is fetched directly, the rest come from batches
+        assert blockchain.direct == [0]
+        assert blockchain.batches[0] == [1, 2, 3, 4]
+    
+    def test_failed_prefetch_falls_back_to_direct_fetch(self):
+        blockchain = FakeBlockchain(tip_height=2)
+        
+        with BlockPrefetcher(blockchain, lookahead=4) as prefetcher:
+            blocks = [prefetcher.get_block_by_height(h) for h in range(3)]
+        
+        assert blocks == [{"hash": f"hash{h}"} for h in range(3)]
+        assert blockchain.direct == [0, 1, 2]
+    
+    def test_invalid_lookahead(self):
+        with pytest.raises(ValueError):
+            BlockPrefetcher(FakeBlockchain(tip_height=0), lookahead=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
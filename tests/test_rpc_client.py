@@ -3,9 +3,14 @@ Test suite for Bitcoin RPC client
 """
 
 import json
+import pickle
 import pytest
 import requests
-from unittest.mock import Mock, patch, MagicMock
+import requests_mock
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 import sys
 import os
 
@@ -13,12 +18,17 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
 
 from rpc_client import BitcoinRPCClient, BitcoinRPCError
-from config import Config
+from src.commands.blockchain import BlockchainCommands
 
 
 class MockConfig:
     """Mock configuration for testing"""
     
+    __slots__ = (
+        'host', 'port', 'user', 'password', 'timeout', 'network',
+        'use_ssl', 'ssl_verify', 'ssl_cert_path', 'log_level', 'log_file',
+    )
+    
     def __init__(self, **kwargs):
         self.host = kwargs.get('host', '127.0.0.1')
         self.port = kwargs.get('port', 8332)
@@ -59,44 +69,126 @@ class TestBitcoinRPCError:
         assert error.message == "Test error"
         assert error.code is None
         assert error.data is None
+    
+    def test_error_pickling(self):
+        """Test errors keep their code and data across processes"""
+        error = pickle.loads(pickle.dumps(BitcoinRPCError("Test error", -5, {"detail": "test"})))
+        
+        assert error.message == "Test error"
+        assert error.code == -5
+        assert error.data == {"detail": "test"}
+        assert str(error) == "Bitcoin RPC Error -5: Test error"
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name):
+    """Canned RPC result from tests/fixtures/<name>.json, parsed once and shared (do not mutate)"""
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text())
+
+
+def rpc_response(body):
+    """Lightweight stand-in for a successful requests.Response with a JSON body"""
+    return SimpleNamespace(
+        status_code=200,
+        content=json.dumps(body).encode(),
+        text="",
+        raise_for_status=lambda: None
+    )
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Default configuration shared by the client tests"""
+    return MockConfig()
+
+
+@pytest.fixture(scope="module")
+def client(config):
+    """
+    One client, and so one session with its mounted adapters, for the module
+    
+    Tests that check fresh or closed client state build their own client.
+    """
+    rpc_client = BitcoinRPCClient(config)
+    yield rpc_client
+    rpc_client.close()
+
+
+@pytest.fixture
+def rpc_mock(client):
+    """requests-mock adapter answering the shared client's HTTP requests for one test"""
+    original = client.session.get_adapter('http://')
+    adapter = requests_mock.Adapter()
+    client.session.mount('http://', adapter)
+    yield adapter
+    client.session.mount('http://', original)
 
 
 class TestBitcoinRPCClient:
     """Test Bitcoin RPC client functionality"""
     
-    def setup_method(self):
-        """Setup for each test method"""
-        self.config = MockConfig()
-        
-    def test_client_initialization(self):
+    def test_client_initialization(self, client, config):
         """Test RPC client initialization"""
-        client = BitcoinRPCClient(self.config)
-        
-        assert client.config == self.config
+        assert client.config == config
         assert client.session is not None
-        assert client.session.auth == ('testuser', 'testpass')
+        assert client.session.headers['Authorization'] == 'Basic dGVzdHVzZXI6dGVzdHBhc3M='
         assert client.session.headers['Content-Type'] == 'application/json'
         assert 'Bitcoin-CLI-Wrapper' in client.session.headers['User-Agent']
     
-    def test_ssl_configuration(self):
+    def test_lazy_session(self, config):
+        """Test the HTTP session is only built when first needed"""
+        with BitcoinRPCClient(config) as client:
+            assert client._session is None
+            
+            session = client.session
+            assert session is not None
+            assert client.session is session
+        
+        # A client closed before first use never builds a session
+        unused = BitcoinRPCClient(config)
+        unused.close()
+        assert unused.session is None
+        with pytest.raises(BitcoinRPCError, match="not initialized"):
+            unused.call("getblockchaininfo")
+    
+    @pytest.mark.parametrize("use_ssl, ssl_verify, cert_path", [
+        (True, True, '/path/to/cert.pem'),
+        (True, False, None),
+        (False, True, None),
+    ])
+    def test_ssl_configuration(self, monkeypatch, use_ssl, ssl_verify, cert_path):
         """Test SSL configuration"""
-        # Test SSL enabled
-        ssl_config = MockConfig(use_ssl=True, ssl_verify=True, ssl_cert_path='/path/to/cert.pem')
-        client = BitcoinRPCClient(ssl_config)
-        
-        assert client.session.verify == True
-        assert client.session.cert == '/path/to/cert.pem'
-        
-        # Test SSL disabled verification
-        ssl_config_no_verify = MockConfig(use_ssl=True, ssl_verify=False)
-        with patch('requests.packages.urllib3.disable_warnings'):
-            client = BitcoinRPCClient(ssl_config_no_verify)
-            assert client.session.verify == False
+        # A CA bundle from the environment would replace verify=True
+        monkeypatch.delenv('REQUESTS_CA_BUNDLE', raising=False)
+        monkeypatch.delenv('CURL_CA_BUNDLE', raising=False)
+        
+        # Keep the warnings filter of the test process untouched
+        disable_warnings = Mock()
+        monkeypatch.setattr('rpc_client.urllib3.disable_warnings', disable_warnings)
+        
+        ssl_config = MockConfig(use_ssl=use_ssl, ssl_verify=ssl_verify, ssl_cert_path=cert_path)
+        with BitcoinRPCClient(ssl_config) as client:
+            assert client.session.verify == ssl_verify
+            assert client.session.cert == cert_path
+        assert disable_warnings.called == (use_ssl and not ssl_verify)
     
-    def test_create_request(self):
+    def test_environment_settings_resolved_once(self, config):
+        """Test proxy settings are read at setup instead of on every request"""
+        with patch.dict(os.environ, {'HTTP_PROXY': 'http://proxy:3128', 'NO_PROXY': ''}):
+            with BitcoinRPCClient(config) as client:
+                assert client.session.trust_env == False
+                assert client.session.proxies['http'] == 'http://proxy:3128'
+        
+        ssl_config = MockConfig(use_ssl=True, ssl_verify=True)
+        with patch.dict(os.environ, {'REQUESTS_CA_BUNDLE': '/etc/ssl/bundle.pem'}):
+            with BitcoinRPCClient(ssl_config) as ssl_client:
+                assert ssl_client.session.verify == '/etc/ssl/bundle.pem'
+    
+    def test_create_request(self, client):
         """Test JSON-RPC request creation"""
-        client = BitcoinRPCClient(self.config)
-        
         request = client._create_request("getblockchaininfo")
         
         assert request["jsonrpc"] == "2.0"
@@ -108,235 +200,221 @@ class TestBitcoinRPCClient:
         request_with_params = client._create_request("getblock", ["hash123", 1])
         
         assert request_with_params["params"] == ["hash123", 1]
+        assert request_with_params["id"] == request["id"] + 1
     
-    def test_handle_response_success(self):
+    def test_encode_request(self, config):
+        """Test serialized requests reuse the per-method envelope"""
+        with BitcoinRPCClient(config) as client:
+            body = json.loads(client._encode_request("getblock", ["hash123", 1]))
+            
+            assert body["jsonrpc"] == "2.0"
+            assert body["method"] == "getblock"
+            assert body["params"] == ["hash123", 1]
+            assert isinstance(body["id"], int)
+            
+            assert json.loads(client._encode_request("getblockcount"))["params"] == []
+            assert set(client._prefix_cache) == {"getblock", "getblockcount"}
+            
+            # Templated bodies decode to the same request as the dict path
+            for method, params in [("getblockcount", None), ("getblock", ["hash123", 2]), ("getblockhash", [0])]:
+                encoded = json.loads(client._encode_request(method, params))
+                expected = client._create_request(method, params)
+                assert encoded["id"] + 1 == expected["id"]
+                assert {**encoded, "id": None} == {**expected, "id": None}
+    
+    def test_handle_response_success(self, client):
         """Test successful response handling"""
-        client = BitcoinRPCClient(self.config)
-        
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response = rpc_response({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"blocks": 100, "chain": "main"}
-        }
+        })
         
         result = client._handle_response(mock_response)
         
         assert result == {"blocks": 100, "chain": "main"}
     
-    def test_handle_response_rpc_error(self):
-        """Test RPC error response handling"""
-        client = BitcoinRPCClient(self.config)
-        
-        # Mock RPC error response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+    @pytest.mark.parametrize("status, content, expected_code, expected_msg", [
+        # JSON-RPC error inside a 200 response
+        (200, json.dumps({
             "jsonrpc": "2.0",
             "id": 1,
-            "error": {
-                "code": -32601,
-                "message": "Method not found"
-            }
-        }
-        
-        with pytest.raises(BitcoinRPCError) as exc_info:
-            client._handle_response(mock_response)
-        
-        assert exc_info.value.code == -32601
-        assert "Method not found" in str(exc_info.value)
-    
-    def test_handle_response_http_error(self):
-        """Test HTTP error response handling"""
-        client = BitcoinRPCClient(self.config)
-        
-        # Mock HTTP 401 error
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
-        
-        with pytest.raises(BitcoinRPCError) as exc_info:
-            client._handle_response(mock_response)
-        
-        assert "Authentication failed" in str(exc_info.value)
-        
-        # Mock HTTP 404 error
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
-        
-        with pytest.raises(BitcoinRPCError) as exc_info:
-            client._handle_response(mock_response)
-        
-        assert "RPC endpoint not found" in str(exc_info.value)
-    
-    def test_handle_response_invalid_json(self):
-        """Test invalid JSON response handling"""
-        client = BitcoinRPCClient(self.config)
-        
+            "error": {"code": -32601, "message": "Method not found"}
+        }).encode(), -32601, "Method not found"),
+        (200, json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -5, "message": "Block not found", "data": None}
+        }).encode(), -5, "Block not found"),
+        # HTTP errors
+        (401, b"Unauthorized", -1, "Authentication failed"),
+        (403, b"Forbidden", -1, "Access forbidden"),
+        (404, b"Not Found", -1, "RPC endpoint not found"),
+        (500, b"Internal Server Error", -1, "HTTP 500: Internal Server Error"),
+        # Body that is not JSON
+        (200, b"Invalid JSON response", -32700, "Invalid JSON response"),
+    ])
+    def test_handle_response_errors(self, client, status, content, expected_code, expected_msg):
+        """Test RPC, HTTP and invalid JSON error responses"""
         mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_response.text = "Invalid JSON response"
+        mock_response.status_code = status
+        mock_response.content = content
+        mock_response.text = content.decode()
+        if status == 200:
+            mock_response.raise_for_status.return_value = None
+        else:
+            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                f"{status} {mock_response.text}"
+            )
         
         with pytest.raises(BitcoinRPCError) as exc_info:
             client._handle_response(mock_response)
         
-        assert exc_info.value.code == -32700
-        assert "Invalid JSON response" in str(exc_info.value)
+        assert exc_info.value.code == expected_code
+        assert expected_msg in str(exc_info.value)
     
-    @patch('requests.Session.post')
-    def test_successful_rpc_call(self, mock_post):
+    def test_successful_rpc_call(self, rpc_mock, client):
         """Test successful RPC call"""
-        client = BitcoinRPCClient(self.config)
-        
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        rpc_mock.register_uri('POST', client.config.rpc_url, json={
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"blocks": 100}
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = client.call("getblockchaininfo")
         
         assert result == {"blocks": 100}
-        assert mock_post.called
+        assert rpc_mock.called
         
         # Verify request parameters
-        call_args = mock_post.call_args
-        assert call_args[1]['timeout'] == 30
+        request = rpc_mock.last_request
+        assert request.timeout == 30
         
         # Verify JSON payload
-        json_data = call_args[1]['json']
+        json_data = request.json()
         assert json_data['method'] == 'getblockchaininfo'
         assert json_data['params'] == []
     
-    @patch('requests.Session.post')
-    def test_rpc_call_with_parameters(self, mock_post):
+    def test_rpc_call_with_parameters(self, rpc_mock, client):
         """Test RPC call with parameters"""
-        client = BitcoinRPCClient(self.config)
-        
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        rpc_mock.register_uri('POST', client.config.rpc_url, json={
             "jsonrpc": "2.0",
             "id": 1,
             "result": "block_data"
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = client.call("getblock", ["hash123", 1])
         
         assert result == "block_data"
         
         # Verify parameters were passed correctly
-        json_data = mock_post.call_args[1]['json']
+        json_data = rpc_mock.last_request.json()
         assert json_data['method'] == 'getblock'
         assert json_data['params'] == ["hash123", 1]
     
-    @patch('requests.Session.post')
-    def test_connection_error(self, mock_post):
+    @patch('rpc_client.time.sleep')
+    def test_connection_error(self, mock_sleep, rpc_mock, client):
         """Test connection error handling"""
-        client = BitcoinRPCClient(self.config)
-        
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        rpc_mock.register_uri('POST', client.config.rpc_url,
+                              exc=requests.exceptions.ConnectionError("Connection refused"))
         
         with pytest.raises(BitcoinRPCError) as exc_info:
             client.call("getblockchaininfo")
         
         assert "Cannot connect to Bitcoin node" in str(exc_info.value)
+        
+        # Read-only calls are retried with exponential backoff
+        assert rpc_mock.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
     
-    @patch('requests.Session.post')
-    def test_timeout_error(self, mock_post):
-        """Test timeout error handling"""
-        client = BitcoinRPCClient(self.config)
+    @patch('rpc_client.time.sleep')
+    def test_write_calls_not_retried(self, mock_sleep, rpc_mock, client):
+        """Test calls with side effects are sent only once"""
+        rpc_mock.register_uri('POST', client.config.rpc_url,
+                              exc=requests.exceptions.ConnectionError("Connection reset"))
+        
+        with pytest.raises(BitcoinRPCError):
+            client.call("sendtoaddress", ["1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2", 0.1])
         
-        mock_post.side_effect = requests.exceptions.Timeout("Request timeout")
+        assert rpc_mock.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    @patch('rpc_client.time.sleep')
+    def test_overloaded_node_retried(self, mock_sleep, rpc_mock, client):
+        """Test read-only calls are retried on transient HTTP statuses"""
+        rpc_mock.register_uri('POST', client.config.rpc_url, [
+            {'status_code': 503},
+            {'json': {"jsonrpc": "2.0", "id": 1, "result": 100, "error": None}}
+        ])
+        
+        assert client.call("getblockcount") == 100
+        assert rpc_mock.call_count == 2
+        mock_sleep.assert_called_once_with(0.5)
+    
+    def test_timeout_error(self, rpc_mock, client):
+        """Test timeout error handling"""
+        rpc_mock.register_uri('POST', client.config.rpc_url,
+                              exc=requests.exceptions.Timeout("Request timeout"))
         
         with pytest.raises(BitcoinRPCError) as exc_info:
             client.call("getblockchaininfo")
         
         assert "Request timeout after 30 seconds" in str(exc_info.value)
     
-    @patch('requests.Session.post')
-    def test_parameter_validation(self, mock_post):
+    def test_parameter_validation(self, rpc_mock, client):
         """Test parameter validation"""
-        client = BitcoinRPCClient(self.config)
-        
         # Test with invalid parameters
         with pytest.raises(BitcoinRPCError) as exc_info:
             client.call("getblock", ["invalid;chars"])
         
         assert "Invalid parameters" in str(exc_info.value)
         assert exc_info.value.code == -32602
+        assert not rpc_mock.called
     
-    @patch('requests.Session.post')
-    def test_connection_test(self, mock_post):
-        """Test connection testing functionality"""
-        client = BitcoinRPCClient(self.config)
+    def test_skip_validation(self, rpc_mock, client):
+        """Test callers that validated params themselves can skip the check"""
+        rpc_mock.register_uri('POST', client.config.rpc_url,
+                              json={"jsonrpc": "2.0", "id": 1, "result": "ok", "error": None})
         
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        with patch('rpc_client.InputValidator.validate_json_rpc_params') as mock_validate:
+            assert client.call("getnewaddress", [""], skip_validation=True) == "ok"
+        
+        mock_validate.assert_not_called()
+        assert rpc_mock.last_request.json()['params'] == [""]
+    
+    def test_unserializable_params(self, rpc_mock, client):
+        """Test params that cannot be encoded as JSON raise BitcoinRPCError before sending"""
+        for call in (lambda: client.call("getblock", [object()], skip_validation=True),
+                     lambda: client.batch_call([("getblock", [object()])], skip_validation=True)):
+            with pytest.raises(BitcoinRPCError) as exc_info:
+                call()
+            assert exc_info.value.code == -32602
+        
+        assert not rpc_mock.called
+    
+    def test_connection_test(self, rpc_mock, client):
+        """Test connection testing functionality"""
+        rpc_mock.register_uri('POST', client.config.rpc_url, json={
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"blocks": 100}
-        }
-        mock_post.return_value = mock_response
+        })
         
         # Test successful connection
         result = client.test_connection()
         assert result == True
         
         # Verify it called getblockchaininfo
-        json_data = mock_post.call_args[1]['json']
-        assert json_data['method'] == 'getblockchaininfo'
+        assert rpc_mock.last_request.json()['method'] == 'getblockchaininfo'
     
-    @patch('requests.Session.post')
-    def test_get_node_info(self, mock_post):
+    def test_get_node_info(self, rpc_mock, client):
         """Test node information gathering"""
-        client = BitcoinRPCClient(self.config)
-        
-        # Mock responses for blockchain and network info
-        blockchain_response = Mock()
-        blockchain_response.status_code = 200
-        blockchain_response.raise_for_status.return_value = None
-        blockchain_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {
-                "chain": "main",
-                "blocks": 100,
-                "bestblockhash": "abc123"
-            }
-        }
-        
-        network_response = Mock()
-        network_response.status_code = 200
-        network_response.raise_for_status.return_value = None
-        network_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "result": {
-                "version": 220000,
-                "subversion": "/Satoshi:22.0.0/",
-                "connections": 8
-            }
-        }
-        
-        mock_post.side_effect = [blockchain_response, network_response]
+        # Mock the batch response for blockchain and network info
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=[
+            {"jsonrpc": "2.0", "id": 0, "result": load_fixture('blockchain_info')},
+            {"jsonrpc": "2.0", "id": 1, "result": load_fixture('network_info')}
+        ])
         
         node_info = client.get_node_info()
         
@@ -344,10 +422,89 @@ class TestBitcoinRPCClient:
         assert node_info["blocks"] == 100
         assert node_info["version"] == 220000
         assert node_info["connections"] == 8
+        
+        # Both RPCs went out in a single batch request
+        assert rpc_mock.call_count == 1
+        assert [item['method'] for item in rpc_mock.last_request.json()] == [
+            "getblockchaininfo", "getnetworkinfo"
+        ]
     
-    def test_context_manager(self):
+    def test_batch_call(self, rpc_mock, client):
+        """Test batched RPC calls are sent in one request and returned in order"""
+        # Bitcoin Core may return batch entries in any order
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=[
+            {"jsonrpc": "2.0", "id": 1, "result": "hash1", "error": None},
+            {"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None}
+        ])
+        
+        result = client.batch_call([("getblockhash", [0]), ("getblockhash", [1])])
+        
+        assert result == ["hash0", "hash1"]
+        assert rpc_mock.call_count == 1
+        
+        json_data = rpc_mock.last_request.json()
+        assert [item['id'] for item in json_data] == [0, 1]
+        assert [item['params'] for item in json_data] == [[0], [1]]
+        assert all(item['method'] == 'getblockhash' for item in json_data)
+    
+    def test_batch_call_error(self, rpc_mock, client):
+        """Test that an error inside a batch is raised with its original code"""
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=[
+            {"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None},
+            {"jsonrpc": "2.0", "id": 1, "result": None,
+             "error": {"code": -8, "message": "Block height out of range"}}
+        ])
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            client.batch_call([("getblockhash", [0]), ("getblockhash", [999999])])
+        
+        assert exc_info.value.code == -8
+        assert "Block height out of range" in str(exc_info.value)
+        
+        # Empty batches never hit the network
+        sent = rpc_mock.call_count
+        assert client.batch_call([]) == []
+        assert rpc_mock.call_count == sent
+    
+    @pytest.mark.parametrize("body", [
+        # Missing id
+        [{"jsonrpc": "2.0", "result": "hash0", "error": None},
+         {"jsonrpc": "2.0", "id": 1, "result": "hash1", "error": None}],
+        # Duplicated id
+        [{"jsonrpc": "2.0", "id": 1, "result": "hash1", "error": None},
+         {"jsonrpc": "2.0", "id": 1, "result": "hash1", "error": None}],
+        # Foreign id
+        [{"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None},
+         {"jsonrpc": "2.0", "id": 7, "result": "hash7", "error": None}],
+        # Not a response object
+        [{"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None}, "hash1"],
+        # Short
+        [{"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None}],
+    ])
+    def test_batch_call_id_mismatch(self, rpc_mock, client, body):
+        """Test batch results are only returned when every request id is answered once"""
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=body)
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            client.batch_call([("getblockhash", [0]), ("getblockhash", [1])])
+        
+        assert exc_info.value.code == -32603
+    
+    def test_batch_call_out_of_order(self, rpc_mock, client):
+        """Test results are placed by id rather than by response position"""
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=[
+            {"jsonrpc": "2.0", "id": 2, "result": "hash2", "error": None},
+            {"jsonrpc": "2.0", "id": 0, "result": "hash0", "error": None},
+            {"jsonrpc": "2.0", "id": 1, "result": "hash1", "error": None}
+        ])
+        
+        result = client.batch_call([("getblockhash", [h]) for h in range(3)])
+        
+        assert result == ["hash0", "hash1", "hash2"]
+    
+    def test_context_manager(self, config):
         """Test context manager functionality"""
-        client = BitcoinRPCClient(self.config)
+        client = BitcoinRPCClient(config)
         
         with client as c:
             assert c.session is not None
@@ -355,9 +512,9 @@ class TestBitcoinRPCClient:
         # Session should be closed after context exit
         assert client.session is None
     
-    def test_session_cleanup(self):
+    def test_session_cleanup(self, config):
         """Test session cleanup"""
-        client = BitcoinRPCClient(self.config)
+        client = BitcoinRPCClient(config)
         
         # Verify session exists
         assert client.session is not None
@@ -370,40 +527,37 @@ class TestBitcoinRPCClient:
         client.close()
         assert client.session is None
     
-    def test_retry_strategy(self):
+    def test_retry_strategy(self, client):
         """Test retry strategy configuration"""
-        client = BitcoinRPCClient(self.config)
-        
         # Verify retry adapter is configured
         adapter = client.session.get_adapter('http://')
-        assert adapter.max_retries.total == 3
-        assert adapter.max_retries.backoff_factor == 1
-        assert 500 in adapter.max_retries.status_forcelist
-        assert 502 in adapter.max_retries.status_forcelist
-        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.total == 1
+        assert adapter.max_retries.backoff_factor == 0
+        
+        # urllib3 must never resend a POST that may have reached the node
+        assert 'POST' not in adapter.max_retries.allowed_methods
+        assert not adapter.max_retries.status_forcelist
     
-    def test_session_configuration(self):
+    def test_session_configuration(self, client, config):
         """Test HTTP session configuration"""
-        client = BitcoinRPCClient(self.config)
-        
         # Check headers
         assert client.session.headers['Content-Type'] == 'application/json'
         assert 'Bitcoin-CLI-Wrapper' in client.session.headers['User-Agent']
         assert client.session.headers['Connection'] == 'keep-alive'
         
-        # Check authentication
-        assert client.session.auth == ('testuser', 'testpass')
+        # Check connection pool sizing
+        assert client.session.get_adapter('http://')._pool_maxsize == 20
+        with BitcoinRPCClient(config, pool_size=4) as pooled_client:
+            assert pooled_client.session.get_adapter('https://')._pool_maxsize == 4
+        
+        # Check authentication is sent as a prebuilt header
+        assert client.session.auth is None
+        assert client.session.headers['Authorization'] == 'Basic dGVzdHVzZXI6dGVzdHBhc3M='
     
-    @patch('requests.Session.post')
-    def test_error_propagation(self, mock_post):
+    def test_error_propagation(self, rpc_mock, client):
         """Test that original Bitcoin errors are preserved"""
-        client = BitcoinRPCClient(self.config)
-        
         # Mock Bitcoin Core error response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        rpc_mock.register_uri('POST', client.config.rpc_url, json={
             "jsonrpc": "2.0",
             "id": 1,
             "error": {
@@ -411,8 +565,7 @@ class TestBitcoinRPCClient:
                 "message": "Block not found",
                 "data": None
             }
-        }
-        mock_post.return_value = mock_response
+        })
         
         with pytest.raises(BitcoinRPCError) as exc_info:
             client.call("getblock", ["nonexistent_hash"])
@@ -422,5 +575,67 @@ class TestBitcoinRPCClient:
         assert "Block not found" in str(exc_info.value)
 
 
+BLOCK_HASHES = [
+    "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f",
+    "00000000839a8e6886ab5951d76f411475428afc90947ee320161bbf18eb6048",
+    "000000006a625f06636b8bb6ac7b960a8d03705d1ace08b1a19da3fdcc99ddbd",
+]
+
+
+def echo_batch(request, context):
+    """Answer a batch in reverse order, each result naming its method and params"""
+    return [
+        {"jsonrpc": "2.0", "id": item["id"], "result": [item["method"], item["params"]], "error": None}
+        for item in reversed(request.json())
+    ]
+
+
+class TestBlockchainBatchCommands:
+    """Test BlockchainCommands batch helpers against the JSON-RPC batch endpoint"""
+    
+    @pytest.fixture
+    def commands(self, client):
+        return BlockchainCommands(client)
+    
+    def test_block_hashes_batch(self, rpc_mock, client, commands):
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=echo_batch)
+        
+        result = commands.get_block_hashes_batch([0, "1", 2])
+        
+        assert result == [["getblockhash", [0]], ["getblockhash", [1]], ["getblockhash", [2]]]
+        assert rpc_mock.call_count == 1
+        assert [item["id"] for item in rpc_mock.last_request.json()] == [0, 1, 2]
+    
+    def test_blocks_batch(self, rpc_mock, client, commands):
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=echo_batch)
+        
+        result = commands.get_blocks_batch(BLOCK_HASHES, verbosity=2)
+        
+        assert result == [["getblock", [block_hash, 2]] for block_hash in BLOCK_HASHES]
+        assert rpc_mock.call_count == 1
+    
+    def test_block_headers_batch(self, rpc_mock, client, commands):
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=echo_batch)
+        
+        result = commands.get_block_headers_batch(BLOCK_HASHES, verbose=False)
+        
+        assert result == [["getblockheader", [block_hash, False]] for block_hash in BLOCK_HASHES]
+        assert rpc_mock.call_count == 1
+    
+    @pytest.mark.parametrize("method, items", [
+        ("get_block_hashes_batch", [0, -1]),
+        ("get_block_hashes_batch", [0, "tip"]),
+        ("get_blocks_batch", [BLOCK_HASHES[0], "not-a-hash"]),
+        ("get_block_headers_batch", [BLOCK_HASHES[0], BLOCK_HASHES[1][:-1]]),
+    ])
+    def test_each_item_validated_before_sending(self, rpc_mock, client, commands, method, items):
+        rpc_mock.register_uri('POST', client.config.rpc_url, json=echo_batch)
+        
+        with pytest.raises(ValueError):
+            getattr(commands, method)(items)
+        
+        assert not rpc_mock.called
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Test suite for wallet RPC commands
+"""
+
+import threading
+import pytest
+import sys
+import os
+
+# Add lib directory to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from rpc_client import BitcoinRPCError
+from src.commands.wallet import WalletCommands
+
+ADDRESSES = [
+    "1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2",
+    "3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy",
+    "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+]
+
+
+class RecordingRPCClient:
+    """Fake RPC client answering through a responder callable and recording calls"""
+    
+    def __init__(self, responder=lambda method, params: None):
+        self.responder = responder
+        self.calls = []
+        self.threads = set()
+    
+    def call(self, method, params=None):
+        self.calls.append((method, params))
+        self.threads.add(threading.get_ident())
+        return self.responder(method, params)
+
+
+class TestWalletFanOut:
+    """Test WalletCommands requests issued concurrently"""
+    
+    def test_fan_out_preserves_order(self):
+        client = RecordingRPCClient(lambda method, params: f"{method}:{params[0]}")
+        wallet = WalletCommands(client, pool_size=2)
+        
+        params_list = [[n] for n in range(6)]
+        
+        assert wallet._fan_out("getblockhash", params_list) == [f"getblockhash:{n}" for n in range(6)]
+        assert len(client.calls) == 6
+        assert sorted(params for _, params in client.calls) == params_list
+    
+    def test_fan_out_single_call_inline(self):
+        client = RecordingRPCClient(lambda method, params: "result")
+        wallet = WalletCommands(client)
+        
+        assert wallet._fan_out("getblockhash", [[0]]) == ["result"]
+        assert wallet._fan_out("getblockhash", []) == []
+        assert client.threads == {threading.get_ident()}
+    
+    def test_fan_out_raises_worker_error(self):
+        def responder(method, params):
+            if params == [ADDRESSES[1]]:
+                raise BitcoinRPCError("Invalid address", -5)
+            return {"address": params[0]}
+        
+        wallet = WalletCommands(RecordingRPCClient(responder))
+        
+        with pytest.raises(BitcoinRPCError) as exc_info:
+            wallet.get_address_info_many(ADDRESSES)
+        
+        assert exc_info.value.code == -5
+    
+    def test_get_address_info_many(self):
+        client = RecordingRPCClient(lambda method, params: {"address": params[0]})
+        wallet = WalletCommands(client)
+        
+        assert wallet.get_address_info_many(ADDRESSES) == [{"address": addr} for addr in ADDRESSES]
+        assert len(client.calls) == len(ADDRESSES)
+        assert all(method == "getaddressinfo" for method, _ in client.calls)
+    
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            WalletCommands(RecordingRPCClient(), pool_size=0)
+    
+    def test_list_unspent_single_call(self):
+        utxos = [{"txid": "b", "vout": 0}, {"txid": "a", "vout": 1}]
+        client = RecordingRPCClient(lambda method, params: utxos)
+        wallet = WalletCommands(client)
+        
+        # All addresses go to the node in one call, which keeps its ordering
+        assert wallet.list_unspent(1, 100, ADDRESSES) == utxos
+        assert client.calls == [("listunspent", [1, 100, ADDRESSES])]
+        
+        wallet.list_unspent()
+        assert client.calls[-1] == ("listunspent", [1, 9999999])
+
+
+class TestWalletParams:
+    """Test positional params sent for optional wallet arguments"""
+    
+    @pytest.mark.parametrize("kwargs, expected", [
+        ({}, None),
+        ({"label": "savings"}, ["savings"]),
+        ({"address_type": "bech32"}, ["", "bech32"]),
+        ({"label": None, "address_type": "bech32"}, ["", "bech32"]),
+        ({"label": "savings", "address_type": "legacy"}, ["savings", "legacy"]),
+    ])
+    def test_get_new_address_params(self, kwargs, expected):
+        client = RecordingRPCClient()
+        WalletCommands(client).get_new_address(**kwargs)
+        assert client.calls == [("getnewaddress", expected)]
+    
+    @pytest.mark.parametrize("kwargs, extra", [
+        ({}, []),
+        ({"comment": "rent"}, ["rent"]),
+        ({"comment_to": "landlord"}, ["", "landlord"]),
+        ({"comment": "rent", "comment_to": "landlord"}, ["rent", "landlord"]),
+        ({"subtract_fee": True}, ["", "", True]),
+        ({"comment": "rent", "subtract_fee": True}, ["rent", "", True]),
+        ({"comment_to": "landlord", "subtract_fee": True}, ["", "landlord", True]),
+        ({"comment": "rent", "comment_to": "landlord", "subtract_fee": True},
+         ["rent", "landlord", True]),
+    ])
+    def test_send_to_address_params(self, kwargs, extra):
+        client = RecordingRPCClient()
+        WalletCommands(client).send_to_address(ADDRESSES[0], 0.5, **kwargs)
+        assert client.calls == [("sendtoaddress", [ADDRESSES[0], 0.5] + extra)]
+    
+    def test_send_to_address_rejects_non_positive_amount(self):
+        client = RecordingRPCClient()
+        with pytest.raises(ValueError):
+            WalletCommands(client).send_to_address(ADDRESSES[0], 0)
+        assert client.calls == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])